@@ -1,24 +1,530 @@
+import gc
+import io
 import os
+import re
+import sys
+import csv
+import json
+import time
+import mmap
+import math
+import bisect
+import struct
+import tempfile
+import itertools
+from array import array
+from contextlib import contextmanager, redirect_stdout
 ###bookcatelog program with persistent storage using text files
 
 FILE_NAME = "book_catalog.txt" # Changed to text file format
-CATALOG = []
+CATALOG = {} # Maps book ID -> book record: a BookTable (or LazyCatalog) once loaded, listed in ID order
 next_id = 1
 DELIMITER = "|" # Define a simple delimiter for text file storage
+JOURNAL_FILE = "book_catalog.journal" # Append-only log of changes made since the last snapshot
+journal_entries = 0 # Number of entries currently in the journal
+catalog_dirty = False # True when CATALOG has changes that are not in the snapshot file yet
+# "eager" parses every book on startup, "lazy" memory-maps the file and parses books on first use (text format only).
+# Lazy mode finds books by binary search, so it needs the file in increasing ID order. save_catalog always
+# writes it that way. The order is spot-checked when the file is mapped, and a file found out of order
+# (e.g. edited by hand) is loaded the eager way instead.
+LOAD_MODE = "eager"
+FILE_FORMAT = "text" # "text" stores books in FILE_NAME as id|title|author|read_status lines, "binary" uses BINARY_FILE_NAME
+BINARY_FILE_NAME = "book_catalog.bin"
+BINARY_MAGIC = b'BKC1' # First bytes of every binary catalog file
+BINARY_HEADER = struct.Struct('<4sQQQ') # magic, number of books, number of strings, size of the string data in bytes
+SEARCH_INDEX = None # Word -> set of book IDs, built the first time a search is run
+SEARCH_WORDS = [] # Sorted list of every word in SEARCH_INDEX, used for prefix matching
+MAX_SEARCH_RESULTS = 50 # Maximum number of matches printed by search_books
+LOAD_BATCH_SIZE = 100_000 # Books added to the BookTable at a time while loading the text file
+IMPORT_BATCH_SIZE = 10000 # Books added (and written to the journal) per batch by import_books
+SORT_INDEXES = {} # Sort key ('title', 'author' or 'read'), or (sort key, read status) for read/unread books only -> sorted list of (value, book ID), built on first use
+PAGE_SIZE = 20 # Number of books shown per page by view_catalog
+
+class Book:
+    """
+    A single book record, used while parsing and for books that are not in a
+    BookTable. Using __slots__ instead of a dict removes the per-book dict
+    overhead, while book['title'] style access keeps working so the rest of the
+    program does not need to change.
+    """
+    __slots__ = ('id', 'title', 'author', 'read')
+
+    def __init__(self, book_id, title, author, read=False):
+        self.id = book_id
+        self.title = title
+        # Many books share an author, so keep a single copy of each author string
+        self.author = sys.intern(author)
+        self.read = read
+
+    def __getitem__(self, key):
+        if key not in Book.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in Book.__slots__:
+            raise KeyError(key)
+        if key == 'author':
+            value = sys.intern(value)
+        setattr(self, key, value)
+
+    def __repr__(self):
+        return f"Book(id={self.id!r}, title={self.title!r}, author={self.author!r}, read={self.read!r})"
+
+class BookTable:
+    """
+    A drop-in replacement for the CATALOG dict that stores books in columns
+    instead of one object per book: IDs in an array, every title packed into one
+    UTF-8 buffer, authors as references into a list of distinct names, and one
+    byte each for the read and deleted flags. That is about 27 bytes per book
+    plus the title text, where a Book object with its dict entry and title
+    string costs over 150 bytes before the text itself.
+
+    Looking a book up returns a BookRow, which reads and writes the columns, so
+    book['title'] style code keeps working. Rows are only ever appended (deleting
+    a book clears its flag), so a BookRow never points at the wrong book. IDs
+    normally arrive in increasing order and are found by binary search; if one
+    ever arrives out of order, a dict from ID to row is used from then on.
+    """
+
+    def __init__(self, books=()):
+        self._ids = array('q')
+        self._title_starts = array('q')
+        self._title_lengths = array('I')
+        self._titles = bytearray()
+        self._author_refs = array('I')
+        self._authors = [] # Each distinct author name once
+        self._author_numbers = {} # Author name -> position in self._authors
+        self._read = bytearray() # 1 if the book has been read, one byte per row
+        self._alive = bytearray() # 0 once the book has been deleted, one byte per row
+        self._count = 0
+        self._rows = None # ID -> row, only built if IDs stop arriving in increasing order
+        self._wasted = 0 # Bytes in self._titles that no title uses any more
+        for book in books:
+            self[book['id']] = book
+
+    def _row(self, book_id):
+        """Returns the row of a book ID (deleted or not), or -1."""
+        if self._rows is not None:
+            return self._rows.get(book_id, -1)
+        row = bisect.bisect_left(self._ids, book_id)
+        return row if row < len(self._ids) and self._ids[row] == book_id else -1
+
+    def _title(self, row):
+        start = self._title_starts[row]
+        return self._titles[start:start + self._title_lengths[row]].decode('utf-8')
+
+    def _set_title(self, row, title):
+        data = title.encode('utf-8')
+        self._wasted += self._title_lengths[row]
+        self._title_starts[row] = len(self._titles)
+        self._title_lengths[row] = len(data)
+        self._titles += data
+        # Edited titles leave their old bytes behind; repack once they are half the buffer
+        if self._wasted > 1024 * 1024 and self._wasted * 2 > len(self._titles):
+            self._pack_titles()
+
+    def _pack_titles(self):
+        """Rebuilds the title buffer without the bytes of old and deleted titles."""
+        packed = bytearray()
+        for row in range(len(self._ids)):
+            if self._alive[row]:
+                start = self._title_starts[row]
+                self._title_starts[row] = len(packed)
+                packed += self._titles[start:start + self._title_lengths[row]]
+            else:
+                self._title_starts[row] = self._title_lengths[row] = 0
+        self._titles = packed
+        self._wasted = 0
+
+    def _set_author(self, row, author):
+        number = self._author_numbers.get(author)
+        if number is None:
+            number = self._author_numbers[author] = len(self._authors)
+            self._authors.append(author)
+        self._author_refs[row] = number
+
+    def __setitem__(self, book_id, book):
+        title, author, read = book['title'], book['author'], book['read']
+        row = self._row(book_id)
+        if row == -1:
+            if self._rows is None and self._ids and book_id < self._ids[-1]:
+                self._rows = {existing_id: existing_row for existing_row, existing_id in enumerate(self._ids)}
+            row = len(self._ids)
+            self._ids.append(book_id)
+            self._title_starts.append(0)
+            self._title_lengths.append(0)
+            self._author_refs.append(0)
+            self._read.append(0)
+            self._alive.append(0)
+            if self._rows is not None:
+                self._rows[book_id] = row
+        if not self._alive[row]:
+            self._alive[row] = 1
+            self._count += 1
+        self._set_title(row, title)
+        self._set_author(row, author)
+        self._read[row] = bool(read)
+
+    def add_many(self, ids, titles, authors, reads):
+        """
+        Adds books given as columns (lists of equal length), much faster than one
+        at a time. Used when loading; falls back to one at a time if the IDs are
+        not new and in increasing order.
+        """
+        if not ids:
+            return
+        in_order = all(map(int.__lt__, ids, ids[1:]))
+        if not in_order or self._rows is not None or (self._ids and ids[0] <= self._ids[-1]):
+            for book in map(Book, ids, titles, authors, reads):
+                self[book.id] = book
+            return
+        encoded = [title.encode('utf-8') for title in titles]
+        lengths = array('I', map(len, encoded))
+        starts = array('q', itertools.accumulate(lengths, initial=len(self._titles)))
+        starts.pop() # The last running total is the end of the new data
+        for author in set(authors).difference(self._author_numbers):
+            self._author_numbers[author] = len(self._authors)
+            self._authors.append(author)
+        self._ids.extend(ids)
+        self._title_starts.extend(starts)
+        self._title_lengths.extend(lengths)
+        self._titles += b''.join(encoded)
+        self._author_refs.extend(map(self._author_numbers.__getitem__, authors))
+        self._read.extend(map(bool, reads))
+        self._alive.extend(bytes([1]) * len(ids))
+        self._count += len(ids)
+
+    def get(self, book_id, default=None):
+        row = self._row(book_id)
+        if row == -1 or not self._alive[row]:
+            return default
+        return BookRow(self, row)
+
+    def __getitem__(self, book_id):
+        book = self.get(book_id)
+        if book is None:
+            raise KeyError(book_id)
+        return book
+
+    def __contains__(self, book_id):
+        return self.get(book_id) is not None
+
+    def pop(self, book_id, default=None):
+        """Deletes a book and returns it. The returned BookRow can still be read until the next edit."""
+        book = self.get(book_id)
+        if book is None:
+            return default
+        self._alive[book._row] = 0
+        self._count -= 1
+        self._wasted += self._title_lengths[book._row]
+        return book
+
+    def __delitem__(self, book_id):
+        if self.pop(book_id) is None:
+            raise KeyError(book_id)
+
+    def values(self):
+        """Yields every book in the order it was added (ID order)."""
+        for row in itertools.compress(range(len(self._ids)), self._alive):
+            yield BookRow(self, row)
+
+    def __iter__(self):
+        for book in self.values():
+            yield book.id
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+class BookRow:
+    """One book of a BookTable. Reads and writes go straight to the table's columns."""
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def id(self):
+        return self._table._ids[self._row]
+
+    @property
+    def title(self):
+        return self._table._title(self._row)
+
+    @title.setter
+    def title(self, value):
+        self._table._set_title(self._row, value)
+
+    @property
+    def author(self):
+        return self._table._authors[self._table._author_refs[self._row]]
+
+    @author.setter
+    def author(self, value):
+        self._table._set_author(self._row, value)
+
+    @property
+    def read(self):
+        return self._table._read[self._row] == 1
+
+    @read.setter
+    def read(self, value):
+        self._table._read[self._row] = bool(value)
+
+    __getitem__ = Book.__getitem__
+    __repr__ = Book.__repr__
+
+    def __setitem__(self, key, value):
+        if key not in Book.__slots__ or key == 'id':
+            raise KeyError(key)
+        setattr(self, key, value)
+
+def parse_book_line(line):
+    """Turns one 'id|title|author|read_status' line into a Book, or None if the line is invalid."""
+    parts = line.strip().split(DELIMITER)
+    if len(parts) != 4:
+        return None
+    try:
+        book_id = int(parts[0])
+    except ValueError:
+        return None
+    return Book(book_id, parts[1], parts[2], parts[3].lower() == 'true')
+
+class LazyCatalog:
+    """
+    A drop-in replacement for the CATALOG dict that reads books straight out of a
+    memory-mapped snapshot file. Nothing is parsed on startup: a book is turned
+    into a Book object the first time it is looked up, and then kept in a small cache.
+
+    Books are found by binary search over the mapped bytes, which works because
+    save_catalog always writes books in increasing ID order (new books always get
+    the next, highest ID). Books changed or added after loading live in memory
+    on top of the file until the next save.
+
+    The file stays mapped until close() is called. Windows will not replace a
+    mapped file, so save_catalog closes it first and calls reopen() afterwards.
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self._map()
+        self._parsed = {}   # Book ID -> Book for snapshot books that have been touched
+        self._deleted = set() # IDs of snapshot books deleted since loading
+        self._added = {}    # Books that are not in the snapshot, in insertion order
+        self._snapshot_count = None
+
+    def _map(self):
+        """Maps the snapshot file. Raises ValueError if its books are clearly not in ID order."""
+        self._file = open(self.file_name, 'rb')
+        self._size = os.path.getsize(self.file_name)
+        # mmap cannot map an empty file, so an empty snapshot simply has no data
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b''
+
+        # Checking every line would cost as much as loading the file, so only the books at
+        # 16 points spread through the file and the last book are compared. This catches
+        # files that were sorted another way or had books appended by hand, which binary
+        # search would otherwise silently report as "not found".
+        sample_ids = []
+        for step in range(16):
+            start = self._mm.rfind(b'\n', 0, self._size * step // 16) + 1
+            book, _ = self._line_at(start)
+            if book is not None:
+                sample_ids.append(book['id'])
+        sample_ids.append(self.last_snapshot_id())
+        if sample_ids != sorted(sample_ids):
+            self.close()
+            raise ValueError(f"{self.file_name} is not in increasing ID order")
+
+    def close(self):
+        """Unmaps the snapshot file. Books changed since loading stay in memory."""
+        if self._size:
+            self._mm.close()
+        self._file.close()
+
+    def reopen(self, saved):
+        """
+        Maps the snapshot file again after close(). If saved is True the file now
+        holds every book, so the changes kept in memory are no longer needed.
+        """
+        self._map()
+        if saved:
+            self._parsed = {}
+            self._deleted = set()
+            self._added = {}
+            self._snapshot_count = None
+
+    def _line_at(self, start):
+        """Returns (book or None, end offset) for the line starting at byte offset 'start'."""
+        end = self._mm.find(b'\n', start)
+        if end == -1:
+            end = self._size
+        line = self._mm[start:end].decode('utf-8', errors='replace')
+        return parse_book_line(line), end
+
+    def _find_in_snapshot(self, book_id):
+        """Binary searches the mapped file for a book ID. Returns the parsed book or None."""
+        lo, hi = 0, self._size # 'lo' always points at the start of a line
+        while lo < hi:
+            mid = (lo + hi) // 2
+            newline = self._mm.rfind(b'\n', lo, mid)
+            start = newline + 1 if newline != -1 else lo
+
+            # Skip over blank or invalid lines until we reach a real book
+            line_start = start
+            book, end = self._line_at(line_start)
+            while book is None and end + 1 < hi:
+                line_start = end + 1
+                book, end = self._line_at(line_start)
+
+            if book is None:
+                hi = start
+            elif book['id'] == book_id:
+                return book
+            elif book['id'] < book_id:
+                lo = end + 1
+            else:
+                hi = start
+        return None
+
+    def _iter_snapshot(self):
+        """Walks the mapped file line by line, yielding each valid book."""
+        start = 0
+        while start < self._size:
+            book, end = self._line_at(start)
+            if book is not None:
+                yield book
+            start = end + 1
+
+    def last_snapshot_id(self):
+        """Returns the highest book ID in the snapshot (the last valid line), or 0."""
+        end = self._size
+        while end > 0:
+            start = self._mm.rfind(b'\n', 0, end - 1) + 1
+            book, _ = self._line_at(start)
+            if book is not None:
+                return book['id']
+            end = start
+        return 0
+
+    def get(self, book_id, default=None):
+        if book_id in self._added:
+            return self._added[book_id]
+        if book_id in self._deleted:
+            return default
+        if book_id not in self._parsed:
+            book = self._find_in_snapshot(book_id)
+            if book is None:
+                return default
+            self._parsed[book_id] = book
+        return self._parsed[book_id]
+
+    def __getitem__(self, book_id):
+        book = self.get(book_id)
+        if book is None:
+            raise KeyError(book_id)
+        return book
+
+    def __contains__(self, book_id):
+        return self.get(book_id) is not None
+
+    def __setitem__(self, book_id, book):
+        if book_id not in self._added and self._find_in_snapshot(book_id) is not None:
+            self._parsed[book_id] = book
+            self._deleted.discard(book_id)
+        else:
+            self._added[book_id] = book
+
+    def pop(self, book_id, default=None):
+        book = self.get(book_id)
+        if book is None:
+            return default
+        if book_id in self._added:
+            del self._added[book_id]
+        else:
+            self._parsed.pop(book_id, None)
+            self._deleted.add(book_id)
+        return book
+
+    def __delitem__(self, book_id):
+        if self.pop(book_id) is None:
+            raise KeyError(book_id)
+
+    def values(self):
+        """Yields every book in order. Untouched books are parsed on the fly and not cached."""
+        for book in self._iter_snapshot():
+            if book['id'] in self._deleted:
+                continue
+            yield self._parsed.get(book['id'], book)
+        yield from self._added.values()
+
+    def __iter__(self):
+        for book in self.values():
+            yield book['id']
+
+    def __len__(self):
+        # The snapshot is counted once, on first use, without caching the parsed books
+        if self._snapshot_count is None:
+            self._snapshot_count = sum(1 for _ in self._iter_snapshot())
+        return self._snapshot_count - len(self._deleted) + len(self._added)
+
+    def __bool__(self):
+        if self._added:
+            return True
+        return next(iter(self.values()), None) is not None
+
+def snapshot_file_name():
+    """Returns the snapshot file used by the selected FILE_FORMAT."""
+    return BINARY_FILE_NAME if FILE_FORMAT == "binary" else FILE_NAME
+
+@contextmanager
+def paused_gc():
+    """
+    Turns off Python's cyclic garbage collector for the duration of a bulk load.
+    Every book created while loading stays alive, so the collector's repeated
+    passes over millions of new objects would find nothing to free.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
 
 def load_catalog():
     """
-    Loads the book catalog from the text file on startup.
+    Loads the book catalog on startup from the snapshot file, then replays any
+    changes recorded in the journal on top of it.
+    """
+    global catalog_dirty
+    catalog_dirty = False
+    with paused_gc():
+        load_snapshot()
+        replay_journal()
+
+def load_snapshot():
+    """
+    Loads the book catalog from the text file.
     Each line in the file is expected to be: id|title|author|read_status
     This implements file storage and error handling (Step 1 & 2).
     """
     global CATALOG
     global next_id
-    if os.path.exists(FILE_NAME):
+    if FILE_FORMAT == "binary":
+        load_catalog_binary()
+    elif LOAD_MODE == "lazy" and os.path.exists(FILE_NAME) and load_catalog_lazy():
+        pass # Mapped. If the file could not be mapped it is read the eager way below
+    elif os.path.exists(FILE_NAME):
         try:
-            CATALOG = []
+            CATALOG = BookTable()
             max_id = 0
-            with open(FILE_NAME, 'r') as f:
+            # Books are handed to the BookTable a column batch at a time, which is much faster than one by one
+            ids, titles, authors, reads = [], [], [], []
+            with open(FILE_NAME, 'r', encoding='utf-8') as f:
                 for line in f:
                     line = line.strip()
                     if not line:
@@ -31,13 +537,13 @@ def load_catalog():
                             book_id = int(parts[0])
                             # Convert file string ('True'/'False') to Python boolean
                             is_read = parts[3].lower() == 'true'
-                            book = {
-                                'id': book_id,
-                                'title': parts[1],
-                                'author': parts[2],
-                                'read': is_read
-                            }
-                            CATALOG.append(book)
+                            ids.append(book_id)
+                            titles.append(parts[1])
+                            authors.append(parts[2])
+                            reads.append(is_read)
+                            if len(ids) == LOAD_BATCH_SIZE:
+                                CATALOG.add_many(ids, titles, authors, reads)
+                                ids, titles, authors, reads = [], [], [], []
                             max_id = max(max_id, book_id)
                         except ValueError:
                             # Skip lines where ID is not a valid integer
@@ -48,6 +554,8 @@ def load_catalog():
                         print(f"[WARNING] Skipping invalid line format in file: {line}")
                         continue
 
+                CATALOG.add_many(ids, titles, authors, reads)
+
                 # Set next_id correctly after loading all valid books
                 if CATALOG:
                     next_id = max_id + 1
@@ -60,39 +568,653 @@ def load_catalog():
         except Exception as e:
             # Step 2: Implement error handling for file operations
             print(f"[ERROR] Failed to read catalog file: {e}. Starting with empty catalog.")
-            CATALOG = []
+            CATALOG = BookTable()
     else:
+        CATALOG = BookTable()
         print(f"[INFO] {FILE_NAME} not found. Starting with a new empty catalog.")
 
-def save_catalog():
+def load_catalog_lazy():
+    """
+    Memory-maps the catalog file instead of reading it, so startup time does not
+    depend on the size of the catalog. Books are parsed the first time they are used.
+    Returns False if the file could not be mapped, so it can be loaded normally instead.
+    """
+    global CATALOG
+    global next_id
+    try:
+        CATALOG = LazyCatalog(FILE_NAME)
+        next_id = CATALOG.last_snapshot_id() + 1
+        print(f"[INFO] Mapped {FILE_NAME} for lazy loading. Books are read on demand.")
+        return True
+    except ValueError as e:
+        print(f"[WARNING] {e}, so books cannot be looked up in it directly. Loading it the eager way instead.")
+    except Exception as e:
+        print(f"[ERROR] Failed to map catalog file: {e}. Loading it the eager way instead.")
+    return False
+
+def load_catalog_binary():
+    """Loads the catalog from the binary snapshot file (see write_binary_catalog for the layout)."""
+    global CATALOG
+    global next_id
+    if not os.path.exists(BINARY_FILE_NAME):
+        CATALOG = BookTable()
+        print(f"[INFO] {BINARY_FILE_NAME} not found. Starting with a new empty catalog.")
+        return
+
+    try:
+        CATALOG = BookTable()
+        CATALOG.add_many(*read_binary_columns(BINARY_FILE_NAME))
+        next_id = max(CATALOG) + 1 if CATALOG else 1
+        print(f"[INFO] Loaded {len(CATALOG)} books from {BINARY_FILE_NAME}.")
+    except Exception as e:
+        print(f"[ERROR] Failed to read catalog file: {e}. Starting with empty catalog.")
+        CATALOG = BookTable()
+        next_id = 1
+
+def replay_journal():
+    """
+    Re-applies every add/update/delete recorded in the journal to CATALOG.
+    Each journal line is a JSON list: ["A" or "U", id, title, author, read] or ["D", id].
+    """
+    global next_id
+    global journal_entries
+    global catalog_dirty
+    journal_entries = 0
+    if not os.path.exists(JOURNAL_FILE):
+        return
+
+    try:
+        with open(JOURNAL_FILE, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    entry = json.loads(line)
+                    op, book_id = entry[0], int(entry[1])
+                    if op in ('A', 'U'):
+                        CATALOG[book_id] = Book(book_id, entry[2], entry[3], bool(entry[4]))
+                        next_id = max(next_id, book_id + 1)
+                    elif op == 'D':
+                        CATALOG.pop(book_id, None)
+                    else:
+                        raise ValueError(f"unknown operation {op!r}")
+                    journal_entries += 1
+                except (ValueError, IndexError, TypeError):
+                    # A crash in the middle of a write can leave a partial last line behind
+                    print(f"[WARNING] Skipping invalid journal entry: {line}")
+                    continue
+
+        if journal_entries:
+            catalog_dirty = True # The snapshot is missing these changes until the next save
+            print(f"[INFO] Replayed {journal_entries} changes from {JOURNAL_FILE}.")
+
+    except Exception as e:
+        print(f"[ERROR] Failed to read journal file: {e}. Changes since the last save may be missing.")
+
+def append_to_journal(op, book_id, book=None):
+    """
+    Durably appends one change to the journal as soon as it happens, so a crash
+    never loses more than the operation in progress. The write cost depends only
+    on the size of the change, not on the size of the catalog.
+    """
+    if book is not None:
+        entry = [op, book_id, book['title'], book['author'], book['read']]
+    else:
+        entry = [op, book_id]
+    return write_journal_entries([entry])
+
+def write_journal_entries(entries):
+    """
+    Appends a list of journal entries with a single write and a single fsync.
+    Returns True once the entries are safely on disk.
+    """
+    global journal_entries
+    global catalog_dirty
+    catalog_dirty = True
+    try:
+        with open(JOURNAL_FILE, 'a') as f:
+            f.write(''.join(json.dumps(entry) + '\n' for entry in entries))
+            f.flush()
+            os.fsync(f.fileno())
+            journal_size = f.tell()
+        journal_entries += len(entries)
+    except Exception as e:
+        print(f"[ERROR] Failed to write journal entry: {e}")
+        return False
+
+    # Once the journal is as big as the snapshot itself, replaying it costs as
+    # much as reading a fresh snapshot, so fold it in. This keeps the amortised
+    # cost of each change constant. File sizes are compared rather than book
+    # counts so that a lazily loaded catalog never has to be counted.
+    snapshot_size = os.path.getsize(snapshot_file_name()) if os.path.exists(snapshot_file_name()) else 0
+    if journal_size > max(snapshot_size, 64 * 1024):
+        compact_catalog()
+    return True
+
+def compact_catalog():
+    """Folds the journal into a new snapshot file and then empties the journal."""
+    global journal_entries
+    if not save_catalog():
+        return
+
+    try:
+        if os.path.exists(JOURNAL_FILE):
+            os.remove(JOURNAL_FILE)
+        journal_entries = 0
+    except Exception as e:
+        print(f"[ERROR] Failed to clear journal file: {e}")
+
+def save_catalog(force=False):
     """
     Persistently saves the current book catalog to the text file.
     Each book is written as a single line, delimited by the pipe character.
     This implements file storage (Step 1).
+    Nothing is written if the catalog has not changed since it was loaded or
+    last saved, unless force is True.
+    Returns True if the snapshot on disk is up to date.
     """
+    global catalog_dirty
+    file_name = snapshot_file_name()
+    if not catalog_dirty and not force:
+        print(f"[INFO] No changes since the last save. {file_name} left as is.")
+        return True
+
+    # Write the new snapshot to a temporary file, flush it to the disk, and only
+    # then rename it over the old one. A crash at any point leaves either the
+    # complete old file or the complete new file, never a half-written one.
+    # (In lazy mode this also keeps the mapped old file intact while we read it.)
+    temp_name = file_name + ".tmp"
+    start_time = time.perf_counter()
     try:
-        with open(FILE_NAME, 'w') as f:
-            for book in CATALOG:
-                # Join the book's properties into a single delimited string
-                line = DELIMITER.join([
-                    str(book['id']),
-                    book['title'],
-                    book['author'],
-                    str(book['read']) # Boolean value converted to string ('True' or 'False')
-                ])
-                f.write(line + '\n')
-            print(f"[INFO] Catalog successfully saved to {FILE_NAME}.")
-        
+        if FILE_FORMAT == "binary":
+            with open(temp_name, 'wb') as f:
+                write_binary_catalog(f, CATALOG.values())
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(temp_name, 'w', encoding='utf-8') as f:
+                write_text_catalog(f, CATALOG.values())
+                f.flush()
+                os.fsync(f.fileno())
+        if isinstance(CATALOG, LazyCatalog) and CATALOG.file_name == file_name:
+            # Windows refuses to replace a file that is still mapped, so let go of the
+            # old snapshot first and map the new one (which holds every book) afterwards
+            CATALOG.close()
+            try:
+                os.replace(temp_name, file_name)
+            except OSError:
+                CATALOG.reopen(saved=False) # The old file is still in place
+                raise
+            CATALOG.reopen(saved=True)
+        else:
+            os.replace(temp_name, file_name)
+        fsync_directory(file_name)
+        catalog_dirty = False
+        elapsed = time.perf_counter() - start_time
+        print(f"[INFO] Catalog successfully saved to {file_name} in {elapsed:.3f}s.")
+        return True
+
     except Exception as e:
         # Step 2: Implement error handling for file operations
         print(f"[ERROR] Failed to write catalog file: {e}")
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        return False
+
+def fsync_directory(file_name):
+    """Flushes the folder holding file_name so a rename into it survives a power cut."""
+    try:
+        folder = os.open(os.path.dirname(os.path.abspath(file_name)), os.O_RDONLY)
+    except OSError:
+        return # Not supported on this platform (e.g. Windows)
+    try:
+        os.fsync(folder)
+    except OSError:
+        pass
+    finally:
+        os.close(folder)
+
+def write_text_catalog(f, books):
+    """Writes books to an open text file, one id|title|author|read_status line each."""
+    for book in books:
+        # Join the book's properties into a single delimited string
+        line = DELIMITER.join([
+            str(book['id']),
+            book['title'],
+            book['author'],
+            str(book['read']) # Boolean value converted to string ('True' or 'False')
+        ])
+        f.write(line + '\n')
+
+def write_binary_catalog(f, books):
+    """
+    Writes books to an open binary file. Layout (all integers little-endian):
+      header:        BINARY_HEADER (magic, book count, string count, string data size)
+      ids:           one int64 per book
+      read flags:    one byte per book (1 = read)
+      title refs:    one uint32 per book, the position of its title in the string table
+      author refs:   one uint32 per book, the position of its author in the string table
+      string table:  one uint32 UTF-8 byte length per string, then the strings back to back
+    Each distinct string is stored once, so an author with many books costs one entry.
+    Strings are length-prefixed rather than delimited, so titles may contain any character.
+    """
+    books = list(books)
+    positions = {} # String -> position in the string table, in the order first seen
+    title_refs = array('I', [positions.setdefault(book.title, len(positions)) for book in books])
+    author_refs = array('I', [positions.setdefault(book.author, len(positions)) for book in books])
+    ids = array('q', [book.id for book in books])
+    flags = bytes([book.read for book in books])
+    encoded = [string.encode('utf-8') for string in positions]
+    lengths = array('I', map(len, encoded))
+    data = b''.join(encoded)
+
+    if sys.byteorder == 'big':
+        for column in (ids, title_refs, author_refs, lengths):
+            column.byteswap()
+    f.write(BINARY_HEADER.pack(BINARY_MAGIC, len(ids), len(lengths), len(data)))
+    for column in (ids.tobytes(), flags, title_refs.tobytes(), author_refs.tobytes(), lengths.tobytes(), data):
+        f.write(column)
+
+def read_binary_catalog(file_name):
+    """Returns an iterator over every Book stored in a binary catalog file written by write_binary_catalog."""
+    return map(Book, *read_binary_columns(file_name))
+
+def read_binary_columns(file_name):
+    """Reads a binary catalog file into (ids, titles, authors, read flags) columns."""
+    with open(file_name, 'rb') as f:
+        data = f.read()
+
+    magic, count, string_count, data_size = BINARY_HEADER.unpack_from(data, 0)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"{file_name} is not a binary book catalog")
+
+    # Cut the file into its columns. array() reads fixed-size integers straight from the bytes.
+    position = BINARY_HEADER.size
+    columns = []
+    for typecode, length in (('q', count), ('B', count), ('I', count), ('I', count), ('I', string_count)):
+        column = array(typecode, data[position:position + length * array(typecode).itemsize])
+        if len(column) != length:
+            raise ValueError(f"{file_name} is truncated")
+        if sys.byteorder == 'big':
+            column.byteswap()
+        columns.append(column)
+        position += length * column.itemsize
+    ids, flags, title_refs, author_refs, lengths = columns
+    string_data = data[position:position + data_size]
+    if len(string_data) != data_size:
+        raise ValueError(f"{file_name} is truncated")
+
+    # Decode the string table once, then look strings up by position. map()
+    # keeps the per-book work in C rather than in a Python loop.
+    ends = list(itertools.accumulate(lengths))
+    starts = [0] + ends[:-1]
+    text = string_data.decode('utf-8')
+    if len(text) == len(string_data):
+        # Plain ASCII: byte offsets equal character offsets, so slice the decoded text
+        strings = list(map(text.__getitem__, map(slice, starts, ends)))
+    else:
+        strings = [string_data[start:end].decode('utf-8') for start, end in zip(starts, ends)]
+    return ids, list(map(strings.__getitem__, title_refs)), list(map(strings.__getitem__, author_refs)), flags
+
+def convert_catalog(target_format):
+    """
+    Converts the snapshot between the text and binary formats ('text' or 'binary').
+    The journal is stored the same way for both formats, so it does not need converting.
+    """
+    if target_format == "binary":
+        source, target = FILE_NAME, BINARY_FILE_NAME
+    else:
+        source, target = BINARY_FILE_NAME, FILE_NAME
+    if not os.path.exists(source):
+        print(f"[ERROR] {source} not found. Nothing to convert.")
+        return
+
+    temp_name = target + ".tmp"
+    try:
+        if target_format == "binary":
+            with open(source, 'r', encoding='utf-8') as src, open(temp_name, 'wb') as dst:
+                books = (book for book in map(parse_book_line, src) if book is not None)
+                write_binary_catalog(dst, books)
+        else:
+            # The text format cannot hold the delimiter or line breaks inside a field
+            books = list(read_binary_catalog(source))
+            text_books = [book for book in books
+                          if not any(bad in book.title or bad in book.author for bad in (DELIMITER, '\n', '\r'))]
+            with open(temp_name, 'w', encoding='utf-8') as dst:
+                write_text_catalog(dst, text_books)
+            if len(text_books) < len(books):
+                print(f"[WARNING] Left out {len(books) - len(text_books)} books whose title or author contains '{DELIMITER}' or a line break.")
+        os.replace(temp_name, target)
+        print(f"[INFO] Converted {source} to {target}.")
+    except Exception as e:
+        print(f"[ERROR] Failed to convert catalog: {e}")
+
+def benchmark_formats(sizes=(10_000, 1_000_000, 10_000_000), repeats=3):
+    """
+    Times save_catalog and load_catalog for the text and binary formats on
+    synthetic catalogs of the given sizes, keeping the best of 'repeats' runs.
+    Files are written to a temporary folder.
+    """
+    global CATALOG, FILE_NAME, BINARY_FILE_NAME, JOURNAL_FILE, FILE_FORMAT, LOAD_MODE
+    saved_settings = (CATALOG, FILE_NAME, BINARY_FILE_NAME, JOURNAL_FILE, FILE_FORMAT, LOAD_MODE)
+
+    print("{:>10}  {:>10} {:>10} {:>8}  {:>10} {:>10} {:>8}".format(
+        "Books", "Text Save", "Bin Save", "Speedup", "Text Load", "Bin Load", "Speedup"))
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            FILE_NAME = os.path.join(folder, "bench_catalog.txt")
+            BINARY_FILE_NAME = os.path.join(folder, "bench_catalog.bin")
+            JOURNAL_FILE = os.path.join(folder, "bench_catalog.journal")
+            LOAD_MODE = "eager"
+
+            for size in sizes:
+                books = {i: Book(i, f"Benchmark Book Title {i}", f"Author {i % 1000}", i % 2 == 0)
+                         for i in range(1, size + 1)}
+                timings = {"text": (float('inf'), float('inf')), "binary": (float('inf'), float('inf'))}
+                for _ in range(repeats):
+                    for file_format in ("text", "binary"):
+                        FILE_FORMAT = file_format
+                        CATALOG = books
+                        with redirect_stdout(io.StringIO()): # Hide the save/load messages
+                            start = time.perf_counter()
+                            save_catalog(force=True)
+                            save_time = time.perf_counter() - start
+                            start = time.perf_counter()
+                            load_catalog()
+                            load_time = time.perf_counter() - start
+                        best_save, best_load = timings[file_format]
+                        timings[file_format] = (min(best_save, save_time), min(best_load, load_time))
+                        CATALOG = {}
+
+                (text_save, text_load), (bin_save, bin_load) = timings["text"], timings["binary"]
+                print("{:>10,}  {:>9.3f}s {:>9.3f}s {:>7.1f}x  {:>9.3f}s {:>9.3f}s {:>7.1f}x".format(
+                    size, text_save, bin_save, text_save / bin_save, text_load, bin_load, text_load / bin_load))
+                del books
+    finally:
+        CATALOG, FILE_NAME, BINARY_FILE_NAME, JOURNAL_FILE, FILE_FORMAT, LOAD_MODE = saved_settings
 
 def get_book_by_id(book_id):
-    """Helper function to find a book by its unique ID."""
-    for book in CATALOG:
-        if book['id'] == book_id:
-            return book
-    return None
+    """Helper function to find a book by its unique ID (constant time dict lookup)."""
+    return CATALOG.get(book_id)
+
+# --- Search Index ---
+
+def book_words(book):
+    """Splits a book's title and author into lowercase search words."""
+    return set(re.findall(r'\w+', f"{book['title']} {book['author']}".lower()))
+
+def index_book(book):
+    """Adds a book to the search and sort indexes. Indexes that have not been built yet are skipped."""
+    for key, index in SORT_INDEXES.items():
+        if isinstance(key, tuple):
+            key, read_status = key
+            if book['read'] != read_status:
+                continue # This index only lists books with the other read status
+        bisect.insort(index, (sort_value(book, key), book['id']))
+
+    if SEARCH_INDEX is None:
+        return
+    for word in book_words(book):
+        ids = SEARCH_INDEX.get(word)
+        if ids is None:
+            ids = SEARCH_INDEX[word] = set()
+            bisect.insort(SEARCH_WORDS, word)
+        ids.add(book['id'])
+
+def unindex_book(book):
+    """Removes a book from the search and sort indexes. Call before the book changes or is deleted."""
+    for key, index in SORT_INDEXES.items():
+        if isinstance(key, tuple):
+            key = key[0] # A book missing from a read/unread index is simply not found below
+        entry = (sort_value(book, key), book['id'])
+        position = bisect.bisect_left(index, entry)
+        if position < len(index) and index[position] == entry:
+            del index[position]
+
+    if SEARCH_INDEX is None:
+        return
+    for word in book_words(book):
+        ids = SEARCH_INDEX.get(word)
+        if ids is None:
+            continue
+        ids.discard(book['id'])
+        if not ids:
+            del SEARCH_INDEX[word]
+            del SEARCH_WORDS[bisect.bisect_left(SEARCH_WORDS, word)]
+
+def build_search_index():
+    """Indexes every book once. Afterwards add/update/delete keep the index up to date."""
+    global SEARCH_INDEX
+    global SEARCH_WORDS
+    SEARCH_INDEX = {}
+    for book in CATALOG.values():
+        for word in book_words(book):
+            SEARCH_INDEX.setdefault(word, set()).add(book['id'])
+    SEARCH_WORDS = sorted(SEARCH_INDEX)
+
+def find_books(query):
+    """
+    Returns the sorted IDs of books matching every word in the query. Each query
+    word also matches longer words that start with it, so 'tolk' finds 'Tolkien'.
+    """
+    if SEARCH_INDEX is None:
+        build_search_index()
+
+    terms = re.findall(r'\w+', query.lower())
+    if not terms:
+        return []
+
+    matches_per_term = []
+    for term in terms:
+        # All words starting with 'term' sit next to each other in the sorted word list
+        start = bisect.bisect_left(SEARCH_WORDS, term)
+        end = bisect.bisect_left(SEARCH_WORDS, term + '\uffff', start)
+        if start == end:
+            return [] # One term has no matches, so the AND of all terms is empty
+        if end - start == 1:
+            matches_per_term.append(SEARCH_INDEX[SEARCH_WORDS[start]])
+        else:
+            matches_per_term.append(set().union(*(SEARCH_INDEX[w] for w in SEARCH_WORDS[start:end])))
+
+    # Intersect starting from the smallest set to keep the work small
+    matches_per_term.sort(key=len)
+    result = set(matches_per_term[0])
+    for ids in matches_per_term[1:]:
+        result &= ids
+        if not result:
+            break
+    return sorted(result)
+
+# --- Sorted Views ---
+
+def sort_value(book, key):
+    """Returns the value a book is ordered by for the given sort key."""
+    if key == 'read':
+        return book['read']
+    return book[key].lower()
+
+def get_sort_index(key, read_filter=None):
+    """
+    Returns the sorted (value, book ID) list for a sort key, building it the first time.
+    With read_filter True or False the list only holds read or unread books.
+    """
+    index_key = key if read_filter is None else (key, read_filter)
+    if index_key not in SORT_INDEXES:
+        SORT_INDEXES[index_key] = sorted((sort_value(book, key), book['id']) for book in CATALOG.values()
+                                         if read_filter is None or book['read'] == read_filter)
+    return SORT_INDEXES[index_key]
+
+def index_range(index, value):
+    """Lazily yields the entries of a sorted index whose value equals 'value', found by binary search."""
+    start = bisect.bisect_left(index, (value,))
+    end = bisect.bisect_left(index, (value, math.inf), start)
+    return (index[position] for position in range(start, end))
+
+def iter_books(sort_key='id', read_filter=None, author=None):
+    """
+    Lazily yields books in the requested order, skipping those that do not match
+    the filters. Callers only pay for the books they actually consume, so showing
+    one page costs about one page of work.
+    read_filter: None for all books, True for read books only, False for unread only.
+    author: if given, only books by this author (case-insensitive).
+    """
+    if author:
+        # Books by one author sit next to each other in the author index, in ID order
+        books = (CATALOG[book_id] for _, book_id in index_range(get_sort_index('author'), author.lower()))
+        if sort_key not in ('id', 'author'):
+            books = iter(sorted(books, key=lambda book: (sort_value(book, sort_key), book['id'])))
+        if read_filter is not None:
+            books = (book for book in books if book['read'] == read_filter) # Only one author's books are checked
+        yield from books
+    elif read_filter is not None and sort_key in ('id', 'read'):
+        # Read (or unread) books sit next to each other in the read index, in ID order
+        for _, book_id in index_range(get_sort_index('read'), read_filter):
+            yield CATALOG[book_id]
+    elif read_filter is not None:
+        # A separate index per read status, so no books have to be skipped
+        for _, book_id in get_sort_index(sort_key, read_filter):
+            yield CATALOG[book_id]
+    elif sort_key == 'id':
+        yield from CATALOG.values() # The catalog is already in ID order
+    else:
+        for _, book_id in get_sort_index(sort_key):
+            yield CATALOG[book_id]
+
+def print_catalog_header(heading):
+    """Prints a table heading for a list of books."""
+    print(f"\n--- {heading} ---")
+    print("{:<5} {:<10} {:<30} {}".format("ID", "Status", "Title", "Author"))
+    print("-" * 75)
+
+def print_book_row(book):
+    """Prints one book as a row of the table started by print_catalog_header."""
+    status = "[READ]" if book['read'] else "[UNREAD]"
+    # Limit title length for clean console display
+    display_title = book['title'][:27] + '...' if len(book['title']) > 30 else book['title']
+    print(f"{book['id']:<5} {status:<10} {display_title:<30} {book['author']}")
+
+# --- Bulk Import / Export ---
+
+def read_import_rows(file_name):
+    """
+    Yields one dict per record from a .csv file (with a title,author[,read] header
+    row) or a .jsonl file (one {"title": ..., "author": ..., "read": ...} object per line).
+    Rows are read one at a time, so the file is never loaded into memory whole.
+    """
+    if file_name.lower().endswith('.csv'):
+        with open(file_name, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+    elif file_name.lower().endswith('.jsonl'):
+        with open(file_name, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    row = None
+                yield row if isinstance(row, dict) else {}
+    else:
+        raise ValueError("only .csv and .jsonl files are supported")
+
+def row_to_book(row, book_id):
+    """
+    Validates an imported row the same way load_catalog validates a line and
+    returns a Book, or None if the row would not survive a save and reload.
+    """
+    title = str(row.get('title') or '').strip()
+    author = str(row.get('author') or '').strip()
+    if not title or not author:
+        return None
+    # A delimiter or line break inside a field would corrupt the text file
+    if any(bad in title or bad in author for bad in (DELIMITER, '\n', '\r')):
+        return None
+    is_read = str(row.get('read', False)).strip().lower() == 'true'
+    return Book(book_id, title, author, is_read)
+
+def import_books(file_name, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Streams books from a CSV or JSONL file into the catalog in batches. Each batch
+    gets a block of IDs starting at next_id and is made durable with one journal write.
+    """
+    global next_id
+    if not os.path.exists(file_name):
+        print(f"[ERROR] Import file {file_name} not found.")
+        return
+
+    imported = 0
+    skipped = 0
+    start_time = time.perf_counter()
+    try:
+        rows = read_import_rows(file_name)
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                break
+
+            books = []
+            for row in batch:
+                book = row_to_book(row, next_id + len(books))
+                if book is None:
+                    skipped += 1
+                else:
+                    books.append(book)
+            if not books:
+                continue
+
+            for book in books:
+                CATALOG[book['id']] = book
+            entries = [['A', book['id'], book['title'], book['author'], book['read']] for book in books]
+            if not write_journal_entries(entries):
+                # Keep memory consistent with what is on disk
+                for book in books:
+                    CATALOG.pop(book['id'], None)
+                print("[ERROR] Import stopped because the batch could not be saved.")
+                break
+
+            for book in books:
+                index_book(book)
+            next_id += len(books)
+            imported += len(books)
+
+    except Exception as e:
+        print(f"[ERROR] Failed to read import file: {e}")
+
+    elapsed = time.perf_counter() - start_time
+    rate = imported / elapsed if elapsed > 0 else 0
+    print(f"[INFO] Imported {imported} books from {file_name} in {elapsed:.2f}s ({rate:,.0f} records/sec).")
+    if skipped:
+        print(f"[WARNING] Skipped {skipped} invalid rows (missing title/author or containing '{DELIMITER}').")
+
+def export_books(file_name):
+    """Streams every book to a CSV or JSONL file (chosen by the file extension)."""
+    exported = 0
+    start_time = time.perf_counter()
+    try:
+        with open(file_name, 'w', encoding='utf-8', newline='') as f:
+            if file_name.lower().endswith('.csv'):
+                writer = csv.writer(f)
+                writer.writerow(['id', 'title', 'author', 'read'])
+                for book in CATALOG.values():
+                    writer.writerow([book['id'], book['title'], book['author'], book['read']])
+                    exported += 1
+            elif file_name.lower().endswith('.jsonl'):
+                for book in CATALOG.values():
+                    f.write(json.dumps({'id': book['id'], 'title': book['title'],
+                                        'author': book['author'], 'read': book['read']}) + '\n')
+                    exported += 1
+            else:
+                raise ValueError("only .csv and .jsonl files are supported")
+    except Exception as e:
+        print(f"[ERROR] Failed to write export file: {e}")
+        return
+
+    elapsed = time.perf_counter() - start_time
+    rate = exported / elapsed if elapsed > 0 else 0
+    print(f"[INFO] Exported {exported} books to {file_name} in {elapsed:.2f}s ({rate:,.0f} records/sec).")
 
 def display_menu():
     """Prints the main menu options to the console."""
@@ -100,10 +1222,11 @@ def display_menu():
     print("      PERSISTENT BOOK CATALOG MANAGER")
     print("="*40)
     print("1. Add New Book (Create)")
-    print("2. View All Books (Read)")
+    print("2. Browse Books (Read)")
     print("3. Update Book Details (Update)")
     print("4. Delete Book (Delete)")
-    print("5. Exit and Save")
+    print("5. Search Books by Title or Author")
+    print("6. Exit and Save")
     print("="*40)
 
 # --- CRUD Operations ---
@@ -118,37 +1241,66 @@ def add_book():
         print("\n[ERROR] Title and Author cannot be empty.")
         return
 
-    new_book = {
-        'id': next_id,
-        'title': title,
-        'author': author,
-        'read': False # Default status
-    }
-    CATALOG.append(new_book)
+    new_book = Book(next_id, title, author, False) # Not read by default
+    CATALOG[next_id] = new_book
+    index_book(new_book)
+    append_to_journal('A', next_id, new_book)
     print(f"\n[SUCCESS] Book '{title}' by {author} (ID: {next_id}) added.")
     next_id += 1
 
-def view_catalog():
-    """Displays all books in the catalog with their status."""
+def view_catalog(sort_key='id', read_filter=None, author=None, browse=True):
+    """
+    Displays the catalog one page at a time. Pages are streamed from iter_books,
+    so each page only costs the books on it. With browse=False only the first
+    page is shown (used before the update/delete prompts).
+    """
     if not CATALOG:
         print("\n[INFO] The book catalog is currently empty.")
         return
 
-    print("\n--- Current Book Catalog ---")
-    print("{:<5} {:<10} {:<30} {}".format("ID", "Status", "Title", "Author"))
-    print("-" * 75)
+    books = iter_books(sort_key, read_filter, author)
+    page_number = 1
+    next_book = next(books, None)
+    if next_book is None:
+        print("\n[INFO] No books match the selected filters.")
+        return
 
-    for book in CATALOG:
-        status = "[READ]" if book['read'] else "[UNREAD]"
-        # Limit title length for clean console display
-        display_title = book['title'][:27] + '...' if len(book['title']) > 30 else book['title']
-        print(f"{book['id']:<5} {status:<10} {display_title:<30} {book['author']}")
+    while next_book is not None:
+        print_catalog_header(f"Book Catalog (Page {page_number})")
+        for book in itertools.chain([next_book], itertools.islice(books, PAGE_SIZE - 1)):
+            print_book_row(book)
+        print("-" * 75)
 
-    print("-" * 75)
+        next_book = next(books, None)
+        if next_book is None:
+            break
+        if not browse:
+            print("[INFO] More books available. Use option 2 to browse the full catalog.")
+            break
+        if input("Press Enter for the next page, or type 'q' to stop: ").strip().lower() == 'q':
+            break
+        page_number += 1
+
+def browse_catalog():
+    """Asks how the catalog should be sorted and filtered, then shows it page by page."""
+    sort_choice = input("Sort by: 1. ID  2. Title  3. Author  4. Read Status [1]: ").strip() or '1'
+    sort_keys = {'1': 'id', '2': 'title', '3': 'author', '4': 'read'}
+    if sort_choice not in sort_keys:
+        print("\n[ERROR] Invalid sort choice.")
+        return
+
+    filter_choice = input("Show: 1. All  2. Read Only  3. Unread Only [1]: ").strip() or '1'
+    read_filters = {'1': None, '2': True, '3': False}
+    if filter_choice not in read_filters:
+        print("\n[ERROR] Invalid filter choice.")
+        return
+
+    author = input("Only show books by author (leave blank for all): ").strip()
+    view_catalog(sort_keys[sort_choice], read_filters[filter_choice], author or None)
 
 def update_book():
     """Allows the user to modify a book's title, author, or status."""
-    view_catalog()
+    view_catalog(browse=False)
     if not CATALOG:
         return
 
@@ -170,19 +1322,28 @@ def update_book():
         if choice == '1':
             new_title = input("Enter the new title: ").strip()
             if new_title:
+                unindex_book(book)
                 book['title'] = new_title
+                index_book(book)
+                append_to_journal('U', book_id, book)
                 print(f"\n[SUCCESS] Book ID {book_id} title updated.")
             else:
                 print("\n[ERROR] Title cannot be empty. No change made.")
         elif choice == '2':
             new_author = input("Enter the new author: ").strip()
             if new_author:
+                unindex_book(book)
                 book['author'] = new_author
+                index_book(book)
+                append_to_journal('U', book_id, book)
                 print(f"\n[SUCCESS] Book ID {book_id} author updated.")
             else:
                 print("\n[ERROR] Author cannot be empty. No change made.")
         elif choice == '3':
+            unindex_book(book)
             book['read'] = not book['read']
+            index_book(book)
+            append_to_journal('U', book_id, book)
             status = "READ" if book['read'] else "UNREAD"
             print(f"\n[SUCCESS] Book ID {book_id} status changed to {status}.")
         else:
@@ -193,7 +1354,7 @@ def update_book():
 
 def delete_book():
     """Prompts the user for a book ID and removes it from the catalog."""
-    view_catalog()
+    view_catalog(browse=False)
     if not CATALOG:
         return
 
@@ -206,12 +1367,35 @@ def delete_book():
     book_to_delete = get_book_by_id(book_id)
 
     if book_to_delete:
-        CATALOG.remove(book_to_delete)
+        unindex_book(book_to_delete)
+        del CATALOG[book_id] # O(1) removal, no list search or shifting
+        append_to_journal('D', book_id)
         print(f"\n[SUCCESS] Book ID {book_id} ('{book_to_delete['title']}') deleted.")
     else:
         print(f"\n[ERROR] Book with ID {book_id} not found.")
 
 
+def search_books():
+    """Prompts for search words and lists the books whose title or author contain all of them."""
+    query = input("Enter words to search for (title or author): ").strip()
+    if not query:
+        print("\n[ERROR] Search cannot be empty.")
+        return
+
+    book_ids = find_books(query)
+    if not book_ids:
+        print(f"\n[INFO] No books match '{query}'.")
+        return
+
+    print_catalog_header(f"{len(book_ids)} Book(s) Matching '{query}'")
+    for book_id in book_ids[:MAX_SEARCH_RESULTS]:
+        print_book_row(CATALOG[book_id])
+
+    print("-" * 75)
+    if len(book_ids) > MAX_SEARCH_RESULTS:
+        print(f"[INFO] Showing the first {MAX_SEARCH_RESULTS} matches. Add more words to narrow the search.")
+
+
 def main():
     """The main application loop."""
     print("Welcome to the Persistent Book Catalog Manager!")
@@ -219,24 +1403,44 @@ def main():
 
     while True:
         display_menu()
-        choice = input("Enter your option (1-5): ").strip()
+        choice = input("Enter your option (1-6): ").strip()
 
         if choice == '1':
             add_book()
         elif choice == '2':
-            view_catalog()
+            browse_catalog()
         elif choice == '3':
             update_book()
         elif choice == '4':
             delete_book()
         elif choice == '5':
-            save_catalog() # Save data to file before exiting
+            search_books()
+        elif choice == '6':
+            compact_catalog() # Fold the journal into a fresh snapshot before exiting
             print("\nExiting. All changes have been saved. Goodbye!")
             break
         else:
-            print("\n[ERROR] Invalid choice. Please enter a number between 1 and 5.")
+            print("\n[ERROR] Invalid choice. Please enter a number between 1 and 6.")
 
 
 # --- Execution Block ---
 if __name__ == "__main__":
-    main()
+    # Bulk mode: python "CRUD(STORE).py" --import books.csv   (or --export books.jsonl)
+    # Format tools: --to-binary / --to-text convert the snapshot, --benchmark [sizes...] compares formats
+    if len(sys.argv) == 3 and sys.argv[1] in ('--import', '--export'):
+        load_catalog()
+        if sys.argv[1] == '--import':
+            import_books(sys.argv[2])
+        else:
+            export_books(sys.argv[2])
+    elif len(sys.argv) == 2 and sys.argv[1] in ('--to-binary', '--to-text'):
+        convert_catalog("binary" if sys.argv[1] == '--to-binary' else "text")
+    elif len(sys.argv) >= 2 and sys.argv[1] == '--benchmark':
+        try:
+            sizes = [int(size) for size in sys.argv[2:]]
+        except ValueError:
+            sizes = []
+            print("Invalid size given. Using the default sizes.")
+        benchmark_formats(sizes or (10_000, 1_000_000, 10_000_000))
+    else:
+        main()
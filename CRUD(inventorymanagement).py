@@ -1,5 +1,803 @@
-INVENTORY = []
-next_id = 1
+import os
+import sys
+import csv
+import json
+import time
+import random
+import bisect
+import sqlite3
+import tempfile
+import itertools
+import threading
+from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+STORAGE_BACKEND = "sqlite" # "sqlite" keeps items in DB_FILE between runs, "memory" keeps them only while the app is open
+DB_FILE = "inventory.db"
+COMMIT_BATCH_SIZE = 100 # Maximum number of writes grouped into one SQLite transaction
+INVENTORY = None # The storage backend, created by open_storage() when the app starts
+LOCK_STRIPES = 64 # Number of locks shared out between items by the stock movement API
+MOVEMENT_CHUNK_SIZE = 1000 # Movements applied together (all or nothing) by the batch mode
+ITEM_COLUMNS = "id, name, quantity, reserved, reorder_level" # Column order SQLiteStorage._item() expects
+HISTORY_FILE = "inventory_history.log" # Append-only log of every quantity change, with periodic snapshots
+HISTORY_INDEX_FILE = "inventory_history.idx" # Time and byte offset of each snapshot in HISTORY_FILE
+HISTORY_SNAPSHOT_MIN_BYTES = 64 * 1024 # Smallest amount of history logged between two snapshots
+
+# --- Storage Backends ---
+# Both backends offer the same methods, so the rest of the program does not care
+# where the items live. Items are returned as {'id', 'name', 'quantity', 'reserved',
+# 'reorder_level'} dicts. Both backends are safe to call from several threads at once.
+
+class MemoryStorage:
+    """
+    Keeps items in a dict for as long as the program runs (nothing is saved).
+    Sorted lists act as secondary indexes, searched with bisect: (lowercase name, id)
+    for name lookups, and (quantity, id) for quantity ranges, split into
+    LOCK_STRIPES lists by item ID. Each quantity list has its own lock, which also
+    guards its items, so stock movements on items in different stripes never wait
+    for each other. Only name changes share one lock. When both are needed, the
+    stripe lock is taken first.
+    """
+
+    def __init__(self):
+        self.items = {} # Item ID -> item dict, in insertion (and therefore ID) order
+        self.ids = itertools.count(1) # next() on a count is atomic, so threads never share an ID
+        self.name_index = []
+        self.name_lock = threading.Lock()
+        self.quantity_indexes = [[] for _ in range(LOCK_STRIPES)]
+        self.stripe_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def _index(self, index, key, item_id):
+        bisect.insort(index, (key, item_id))
+
+    def _unindex(self, index, key, item_id):
+        del index[bisect.bisect_left(index, (key, item_id))]
+
+    def add(self, name, quantity, reorder_level=0):
+        item = {'id': next(self.ids), 'name': name, 'quantity': quantity, 'reserved': 0,
+                'reorder_level': reorder_level}
+        stripe = item['id'] % LOCK_STRIPES
+        with self.stripe_locks[stripe]:
+            self.items[item['id']] = item
+            self._index(self.quantity_indexes[stripe], quantity, item['id'])
+            with self.name_lock:
+                self._index(self.name_index, name.lower(), item['id'])
+        return dict(item)
+
+    def get(self, item_id):
+        item = self.items.get(item_id)
+        return dict(item) if item else None
+
+    def update(self, item_id, name=None, quantity=None, reserved=None, reorder_level=None):
+        stripe = item_id % LOCK_STRIPES
+        with self.stripe_locks[stripe]:
+            item = self.items[item_id]
+            # Only move the index entries whose key actually changes
+            if name is not None and name != item['name']:
+                with self.name_lock:
+                    self._unindex(self.name_index, item['name'].lower(), item_id)
+                    item['name'] = name
+                    self._index(self.name_index, name.lower(), item_id)
+            if quantity is not None and quantity != item['quantity']:
+                self._unindex(self.quantity_indexes[stripe], item['quantity'], item_id)
+                item['quantity'] = quantity
+                self._index(self.quantity_indexes[stripe], quantity, item_id)
+            if reserved is not None:
+                item['reserved'] = reserved
+            if reorder_level is not None:
+                item['reorder_level'] = reorder_level
+
+    def delete(self, item_id):
+        stripe = item_id % LOCK_STRIPES
+        with self.stripe_locks[stripe]:
+            item = self.items.pop(item_id, None)
+            if item is None:
+                return False
+            self._unindex(self.quantity_indexes[stripe], item['quantity'], item_id)
+            with self.name_lock:
+                self._unindex(self.name_index, item['name'].lower(), item_id)
+            return True
+
+    def all(self):
+        for item in list(self.items.values()): # Copy so other threads may add/delete meanwhile
+            yield dict(item)
+
+    def find_by_name(self, prefix):
+        """Items whose name starts with prefix (any case), in name order."""
+        prefix = prefix.lower()
+        with self.name_lock:
+            start = bisect.bisect_left(self.name_index, (prefix,))
+            matches = itertools.takewhile(lambda entry: entry[0].startswith(prefix),
+                                          itertools.islice(self.name_index, start, None))
+            found = [self.items.get(item_id) for _, item_id in matches]
+        # delete() removes the item just before its name entry, so skip items that are already gone
+        return [dict(item) for item in found if item is not None]
+
+    def items_below(self, limit):
+        """Items with quantity < limit, lowest quantity first."""
+        found = []
+        for index, lock in zip(self.quantity_indexes, self.stripe_locks):
+            with lock:
+                end = bisect.bisect_left(index, (limit,))
+                found.extend(dict(self.items[item_id]) for _, item_id in index[:end])
+        return sorted(found, key=lambda item: (item['quantity'], item['id']))
+
+    def items_below_reorder_level(self):
+        """Items whose quantity is below their own reorder level."""
+        return [dict(item) for item in list(self.items.values()) if item['quantity'] < item['reorder_level']]
+
+    def apply_deltas(self, deltas):
+        """
+        Adds each delta in {item_id: delta} to its item's quantity, all or nothing:
+        if any item is missing or would drop below zero, nothing is changed.
+        Returns the changed items.
+        """
+        # Take the stripe locks in a fixed order, so two batches can never deadlock
+        stripes = sorted({item_id % LOCK_STRIPES for item_id in deltas})
+        for stripe in stripes:
+            self.stripe_locks[stripe].acquire()
+        try:
+            for item_id, delta in deltas.items():
+                item = self.items.get(item_id)
+                if item is None:
+                    raise StockError(f"Item with ID {item_id} not found.")
+                if item['quantity'] + delta < 0:
+                    raise StockError(f"Item {item_id} has only {item['quantity']} in stock, cannot remove {-delta}.")
+            changed = []
+            for item_id, delta in deltas.items():
+                if delta:
+                    item = self.items[item_id]
+                    index = self.quantity_indexes[item_id % LOCK_STRIPES]
+                    self._unindex(index, item['quantity'], item_id)
+                    item['quantity'] += delta
+                    self._index(index, item['quantity'], item_id)
+                    changed.append(dict(item))
+            return changed
+        finally:
+            for stripe in reversed(stripes):
+                self.stripe_locks[stripe].release()
+
+    def is_empty(self):
+        return not self.items
+
+    def commit(self):
+        pass # Nothing to flush
+
+    def close(self):
+        pass
+
+class SQLiteStorage:
+    """
+    Keeps items in a local SQLite database file. Items are looked up through the
+    INTEGER PRIMARY KEY index, every query uses a fixed SQL string with '?'
+    parameters (so SQLite prepares each statement once and reuses it), and
+    writes are grouped into transactions of up to COMMIT_BATCH_SIZE changes.
+    A single connection is shared and every call holds its lock, so this backend
+    serialises all calls, including stock movements on different items. SQLite
+    lets only one connection write at a time anyway, and a connection per thread
+    would have to commit every write instead of batching them.
+    """
+
+    def __init__(self, file_name):
+        self.conn = sqlite3.connect(file_name, check_same_thread=False)
+        self.lock = threading.Lock()
+        # WAL mode makes each commit a cheap append instead of a rewrite of the pages
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT," # Never reuse the ID of a deleted item
+            " name TEXT NOT NULL,"
+            " quantity INTEGER NOT NULL CHECK (quantity >= 0),"
+            " reserved INTEGER NOT NULL DEFAULT 0 CHECK (reserved >= 0),"
+            " reorder_level INTEGER NOT NULL DEFAULT 0 CHECK (reorder_level >= 0))"
+        )
+        # Databases created by older versions are missing the newer columns
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(items)")]
+        for column in ('reserved', 'reorder_level'):
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE items ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+        # Secondary indexes for name lookups (any case) and quantity range queries
+        self.conn.execute("CREATE INDEX IF NOT EXISTS items_name ON items (name COLLATE NOCASE)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS items_quantity ON items (quantity)")
+        self.conn.commit()
+        self.pending_writes = 0
+
+    @staticmethod
+    def _item(row):
+        """Turns a row selected with ITEM_COLUMNS into an item dict."""
+        return {'id': row[0], 'name': row[1], 'quantity': row[2], 'reserved': row[3], 'reorder_level': row[4]}
+
+    def _written(self):
+        """Counts a write and commits once a full batch has built up. Call with the lock held."""
+        self.pending_writes += 1
+        if self.pending_writes >= COMMIT_BATCH_SIZE:
+            self.conn.commit()
+            self.pending_writes = 0
+
+    def add(self, name, quantity, reorder_level=0):
+        with self.lock:
+            cursor = self.conn.execute("INSERT INTO items (name, quantity, reorder_level) VALUES (?, ?, ?)",
+                                       (name, quantity, reorder_level))
+            self._written()
+        return {'id': cursor.lastrowid, 'name': name, 'quantity': quantity, 'reserved': 0,
+                'reorder_level': reorder_level}
+
+    def get(self, item_id):
+        with self.lock:
+            row = self.conn.execute(f"SELECT {ITEM_COLUMNS} FROM items WHERE id = ?", (item_id,)).fetchone()
+        return self._item(row) if row else None
+
+    def update(self, item_id, name=None, quantity=None, reserved=None, reorder_level=None):
+        with self.lock:
+            if name is not None:
+                self.conn.execute("UPDATE items SET name = ? WHERE id = ?", (name, item_id))
+            if quantity is not None:
+                self.conn.execute("UPDATE items SET quantity = ? WHERE id = ?", (quantity, item_id))
+            if reserved is not None:
+                self.conn.execute("UPDATE items SET reserved = ? WHERE id = ?", (reserved, item_id))
+            if reorder_level is not None:
+                self.conn.execute("UPDATE items SET reorder_level = ? WHERE id = ?", (reorder_level, item_id))
+            self._written()
+
+    def delete(self, item_id):
+        with self.lock:
+            cursor = self.conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+            self._written()
+        return cursor.rowcount > 0
+
+    def all(self):
+        # Rows are fetched a chunk at a time, so the whole table is never held in memory
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(f"SELECT {ITEM_COLUMNS} FROM items ORDER BY id")
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(500)
+            if not rows:
+                break
+            for row in rows:
+                yield self._item(row)
+
+    def find_by_name(self, prefix):
+        """Items whose name starts with prefix (any case), in name order. Uses the items_name index."""
+        # A range on the NOCASE index finds every name starting with the prefix
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {ITEM_COLUMNS} FROM items"
+                " WHERE name >= ? COLLATE NOCASE AND name < ? COLLATE NOCASE"
+                " ORDER BY name COLLATE NOCASE, id",
+                (prefix, prefix + '\U0010ffff')).fetchall()
+        return [self._item(row) for row in rows]
+
+    def items_below(self, limit):
+        """Items with quantity < limit, lowest quantity first. Uses the items_quantity index."""
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {ITEM_COLUMNS} FROM items WHERE quantity < ? ORDER BY quantity, id",
+                (limit,)).fetchall()
+        return [self._item(row) for row in rows]
+
+    def items_below_reorder_level(self):
+        """Items whose quantity is below their own reorder level."""
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {ITEM_COLUMNS} FROM items WHERE quantity < reorder_level").fetchall()
+        return [self._item(row) for row in rows]
+
+    def apply_deltas(self, deltas):
+        """
+        Adds each delta in {item_id: delta} to its item's quantity in a single
+        transaction: if any item is missing or would drop below zero, it is rolled back.
+        Returns the changed items.
+        """
+        with self.lock:
+            # Commit earlier writes first so a rollback can only undo this batch
+            self.conn.commit()
+            self.pending_writes = 0
+            try:
+                cursor = self.conn.executemany("UPDATE items SET quantity = quantity + ? WHERE id = ?",
+                                               [(delta, item_id) for item_id, delta in deltas.items()])
+                if cursor.rowcount != len(deltas):
+                    raise StockError("Batch refers to an item that does not exist.")
+                # Read the new quantities back, a few hundred IDs per query
+                item_ids = list(deltas)
+                changed = []
+                for start in range(0, len(item_ids), 500):
+                    chunk = item_ids[start:start + 500]
+                    changed.extend(map(self._item, self.conn.execute(
+                        f"SELECT {ITEM_COLUMNS} FROM items WHERE id IN ({','.join('?' * len(chunk))})", chunk)))
+                self.conn.commit()
+                return changed
+            except sqlite3.IntegrityError:
+                # The CHECK (quantity >= 0) constraint rejected one of the updates
+                self.conn.rollback()
+                raise StockError("Batch would drop an item's quantity below zero.")
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def is_empty(self):
+        with self.lock:
+            return self.conn.execute("SELECT 1 FROM items LIMIT 1").fetchone() is None
+
+    def commit(self):
+        with self.lock:
+            self.conn.commit()
+            self.pending_writes = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+def open_storage():
+    """Creates the storage backend selected by STORAGE_BACKEND."""
+    if STORAGE_BACKEND == "sqlite":
+        try:
+            storage = SQLiteStorage(DB_FILE)
+            print(f"[INFO] Using SQLite storage in {DB_FILE}.")
+            return storage
+        except sqlite3.Error as e:
+            print(f"[ERROR] Could not open {DB_FILE}: {e}. Falling back to in-memory storage.")
+    print("[INFO] Using in-memory storage. Items will be lost when the app closes.")
+    return MemoryStorage()
+
+# --- Stock Movement API ---
+# These functions can be called from many threads at once. Each item is guarded
+# by one of LOCK_STRIPES locks (picked by item ID), so threads working on
+# different items rarely wait for each other here. MemoryStorage is striped the
+# same way, so with it there is no global lock. SQLiteStorage still serialises
+# every call on its single connection, so with it movements on different items
+# still take turns inside the database.
+
+class StockError(Exception):
+    """Raised when a stock movement cannot be applied (unknown item, not enough stock)."""
+
+ITEM_LOCKS = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+def item_lock(item_id):
+    """Returns the lock that guards the given item."""
+    return ITEM_LOCKS[item_id % LOCK_STRIPES]
+
+def _get_or_fail(item_id):
+    """Fetches an item, raising StockError if it does not exist. Call with the item's lock held."""
+    item = INVENTORY.get(item_id)
+    if item is None:
+        raise StockError(f"Item with ID {item_id} not found.")
+    return item
+
+def set_quantity(item_id, quantity):
+    """Sets an item's available quantity."""
+    if quantity < 0:
+        raise StockError("Quantity must be zero or a positive number.")
+    with item_lock(item_id):
+        item = _get_or_fail(item_id)
+        INVENTORY.update(item_id, quantity=quantity)
+        item['quantity'] = quantity
+        stock_changed([item])
+    return quantity
+
+def adjust_quantity(item_id, delta):
+    """Adds delta (negative to remove stock) to an item's quantity and returns the new quantity."""
+    with item_lock(item_id):
+        item = _get_or_fail(item_id)
+        new_quantity = item['quantity'] + delta
+        if new_quantity < 0:
+            raise StockError(f"Item {item_id} has only {item['quantity']} in stock, cannot remove {-delta}.")
+        INVENTORY.update(item_id, quantity=new_quantity)
+        item['quantity'] = new_quantity
+        stock_changed([item])
+    return new_quantity
+
+def reserve(item_id, amount):
+    """Moves 'amount' units from available stock into the item's reserved stock."""
+    if amount <= 0:
+        raise StockError("Reservation amount must be a positive number.")
+    with item_lock(item_id):
+        item = _get_or_fail(item_id)
+        if item['quantity'] < amount:
+            raise StockError(f"Item {item_id} has only {item['quantity']} available, cannot reserve {amount}.")
+        INVENTORY.update(item_id, quantity=item['quantity'] - amount, reserved=item['reserved'] + amount)
+        item['quantity'] -= amount
+        stock_changed([item])
+    return item['quantity']
+
+def release(item_id, amount):
+    """Returns 'amount' previously reserved units to the item's available stock."""
+    if amount <= 0:
+        raise StockError("Release amount must be a positive number.")
+    with item_lock(item_id):
+        item = _get_or_fail(item_id)
+        if item['reserved'] < amount:
+            raise StockError(f"Item {item_id} has only {item['reserved']} reserved, cannot release {amount}.")
+        INVENTORY.update(item_id, quantity=item['quantity'] + amount, reserved=item['reserved'] - amount)
+        item['quantity'] += amount
+        stock_changed([item])
+    return item['quantity']
+
+def set_reorder_level(item_id, reorder_level):
+    """Sets the quantity an item should not drop below (0 turns its alerts off)."""
+    if reorder_level < 0:
+        raise StockError("Reorder level must be zero or a positive number.")
+    with item_lock(item_id):
+        item = _get_or_fail(item_id)
+        INVENTORY.update(item_id, reorder_level=reorder_level)
+        item['reorder_level'] = reorder_level
+        check_reorder_level(item)
+    return reorder_level
+
+def remove_item(item_id):
+    """Deletes an item, waiting for any movement on it to finish first."""
+    with item_lock(item_id):
+        LOW_STOCK.discard(item_id)
+        deleted = INVENTORY.delete(item_id)
+        if deleted:
+            record_history([(item_id, None)])
+        return deleted
+
+def apply_movements(deltas, times=None):
+    """
+    Applies {item_id: delta} as one all-or-nothing change. The locks of every
+    item involved are taken in a fixed order, so two batches can never deadlock.
+    'times' optionally gives {item_id: Unix time} of when each movement happened,
+    for the stock history (see record_history()).
+    """
+    stripes = sorted({item_id % LOCK_STRIPES for item_id in deltas})
+    for stripe in stripes:
+        ITEM_LOCKS[stripe].acquire()
+    try:
+        stock_changed(INVENTORY.apply_deltas(deltas), times)
+    finally:
+        for stripe in reversed(stripes):
+            ITEM_LOCKS[stripe].release()
+
+# --- Low Stock Alerts ---
+# LOW_STOCK holds the IDs of the items that are currently below their reorder
+# level. It is filled once when the app starts and then kept up to date by the
+# stock movement API, which checks only the item it just changed (an O(1) set
+# update), so finding the items to reorder never needs a scan of the inventory.
+
+LOW_STOCK = set()
+LOW_STOCK_LISTENERS = [] # Functions called as listener(event, item), event is 'low' or 'restocked'
+
+def print_stock_alert(event, item):
+    """The default listener: prints a line whenever an item crosses its reorder level."""
+    if event == 'low':
+        print(f"[ALERT] Item {item['id']} ('{item['name']}') is low on stock: "
+              f"{item['quantity']} left, reorder level is {item['reorder_level']}.")
+    else:
+        print(f"[INFO] Item {item['id']} ('{item['name']}') is back at or above its reorder level "
+              f"({item['quantity']} in stock).")
+
+LOW_STOCK_LISTENERS.append(print_stock_alert)
+
+def check_reorder_level(item):
+    """
+    Updates LOW_STOCK for an item that has just changed, and tells the listeners
+    if it crossed its reorder level. Call with the item's lock held.
+    """
+    is_low = item['quantity'] < item['reorder_level']
+    if is_low == (item['id'] in LOW_STOCK):
+        return # Still on the same side of the threshold
+    if is_low:
+        LOW_STOCK.add(item['id'])
+    else:
+        LOW_STOCK.discard(item['id'])
+    for listener in LOW_STOCK_LISTENERS:
+        listener('low' if is_low else 'restocked', item)
+
+def load_low_stock():
+    """Fills LOW_STOCK from the storage backend. Called once after open_storage()."""
+    LOW_STOCK.clear()
+    LOW_STOCK.update(item['id'] for item in INVENTORY.items_below_reorder_level())
+    if LOW_STOCK:
+        print(f"[WARNING] {len(LOW_STOCK)} item(s) are below their reorder level. See the Low Stock Report.")
+
+def low_stock_items():
+    """The items currently below their reorder level, lowest quantity first."""
+    items = [item for item in map(INVENTORY.get, list(LOW_STOCK)) if item]
+    return sorted(items, key=lambda item: (item['quantity'], item['id']))
+
+def stock_changed(items, times=None):
+    """Checks reorder levels and records history for items whose quantity just changed. Call with their locks held."""
+    for item in items:
+        check_reorder_level(item)
+    record_history([(item['id'], item['quantity']) for item in items], times)
+
+# --- Stock History ---
+# Every quantity change is appended to HISTORY_FILE as a JSON line
+# {"t": time, "id": item_id, "q": new quantity (null once deleted)}. Once the changes
+# logged since the last snapshot take up more bytes than that snapshot (and at
+# least HISTORY_SNAPSHOT_MIN_BYTES), a new snapshot line {"t": time, "snapshot":
+# {id: quantity}} of the whole inventory is added, and its byte offset is noted in
+# HISTORY_INDEX_FILE. Like the catalog journal in CRUD(STORE).py, this keeps the
+# amortised snapshot cost per change constant however large the inventory is.
+# To find the stock at time T we bisect for the last snapshot taken before T,
+# seek straight to it and replay the changes after it, which are never much
+# bigger than the snapshot itself.
+
+HISTORY_LOG = None # Append handle on HISTORY_FILE, opened by open_history(); None means nothing is recorded
+HISTORY_LOCK = threading.Lock() # Keeps lines from different threads whole and in time order
+SNAPSHOT_TIMES = [] # Time of each snapshot, oldest first
+SNAPSHOT_OFFSETS = [] # Byte offset of each snapshot line in HISTORY_FILE
+snapshot_bytes = 0 # Size of the last snapshot line
+bytes_since_snapshot = 0 # Size of the change lines logged after it
+last_history_time = 0.0 # Time of the newest line in the log; later lines are never stamped earlier
+
+def read_history(offset=0):
+    """Streams the entries of HISTORY_FILE from a byte offset, skipping damaged lines."""
+    with open(HISTORY_FILE, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue # Half-written line from a crash
+
+def rebuild_history_index():
+    """Recreates HISTORY_INDEX_FILE by scanning HISTORY_FILE for snapshot lines."""
+    SNAPSHOT_TIMES.clear()
+    SNAPSHOT_OFFSETS.clear()
+    offset = 0
+    with open(HISTORY_FILE, 'rb') as f:
+        for line in f:
+            if b'"snapshot"' in line:
+                try:
+                    SNAPSHOT_TIMES.append(json.loads(line)['t'])
+                    SNAPSHOT_OFFSETS.append(offset)
+                except ValueError:
+                    pass
+            offset += len(line)
+    with open(HISTORY_INDEX_FILE, 'w', encoding='utf-8') as f:
+        for snapshot_time, snapshot_offset in zip(SNAPSHOT_TIMES, SNAPSHOT_OFFSETS):
+            f.write(f"{snapshot_time!r} {snapshot_offset}\n")
+    print(f"[INFO] Rebuilt the history index ({len(SNAPSHOT_OFFSETS)} snapshots).")
+
+def open_history():
+    """Loads the snapshot index and opens HISTORY_FILE for appending. Called once after open_storage()."""
+    global HISTORY_LOG, snapshot_bytes, bytes_since_snapshot, last_history_time
+    SNAPSHOT_TIMES.clear()
+    SNAPSHOT_OFFSETS.clear()
+    if os.path.exists(HISTORY_INDEX_FILE):
+        with open(HISTORY_INDEX_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    snapshot_time, snapshot_offset = line.split()
+                    SNAPSHOT_TIMES.append(float(snapshot_time))
+                    SNAPSHOT_OFFSETS.append(int(snapshot_offset))
+                except ValueError:
+                    break # Half-written last line
+
+    log_size = os.path.getsize(HISTORY_FILE) if os.path.exists(HISTORY_FILE) else 0
+    if log_size and (not SNAPSHOT_OFFSETS or SNAPSHOT_OFFSETS[-1] >= log_size):
+        rebuild_history_index() # Index missing or out of step with the log
+
+    HISTORY_LOG = open(HISTORY_FILE, 'ab')
+    if log_size:
+        with open(HISTORY_FILE, 'rb') as f:
+            f.seek(log_size - 1)
+            if f.read(1) != b'\n':
+                HISTORY_LOG.write(b'\n') # Never append to a half-written line
+                log_size += 1
+
+    with HISTORY_LOCK:
+        if SNAPSHOT_OFFSETS:
+            with open(HISTORY_FILE, 'rb') as f:
+                f.seek(SNAPSHOT_OFFSETS[-1])
+                snapshot_bytes = len(f.readline())
+            bytes_since_snapshot = log_size - SNAPSHOT_OFFSETS[-1] - snapshot_bytes
+            # Change lines are short, so the newest one is in the last few KB (unless it is the snapshot)
+            last_history_time = SNAPSHOT_TIMES[-1]
+            with open(HISTORY_FILE, 'rb') as f:
+                f.seek(max(SNAPSHOT_OFFSETS[-1] + snapshot_bytes, log_size - 4096))
+                for line in reversed(f.read().splitlines()):
+                    try:
+                        last_history_time = max(last_history_time, json.loads(line)['t'])
+                        break
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        else:
+            write_history_snapshot() # The starting point for all later queries
+
+def close_history():
+    global HISTORY_LOG
+    if HISTORY_LOG is not None:
+        HISTORY_LOG.close()
+        HISTORY_LOG = None
+
+def write_history_snapshot():
+    """Appends a snapshot of every item's quantity to the log. Call with HISTORY_LOCK held."""
+    global snapshot_bytes, bytes_since_snapshot, last_history_time
+    HISTORY_LOG.flush()
+    offset = HISTORY_LOG.tell()
+    snapshot_time = max(time.time(), last_history_time)
+    last_history_time = snapshot_time
+    quantities = {item['id']: item['quantity'] for item in INVENTORY.all()}
+    line = json.dumps({'t': snapshot_time, 'snapshot': quantities}).encode('utf-8') + b'\n'
+    HISTORY_LOG.write(line)
+    HISTORY_LOG.flush()
+    # The log line goes first, so the index never points past the end of the log
+    with open(HISTORY_INDEX_FILE, 'a', encoding='utf-8') as f:
+        f.write(f"{snapshot_time!r} {offset}\n")
+    SNAPSHOT_TIMES.append(snapshot_time)
+    SNAPSHOT_OFFSETS.append(offset)
+    snapshot_bytes = len(line)
+    bytes_since_snapshot = 0
+
+def record_history(changes, times=None):
+    """
+    Appends (item_id, quantity) changes to the log, adding a snapshot when one is due.
+    Changes are stamped with the current time, unless 'times' gives {item_id: Unix time}
+    of when they happened (e.g. the timestamps of a movements file). inventory_at()
+    needs the log in time order, so a change is never stamped later than now or
+    earlier than the newest line already logged: movements that arrive out of
+    order are recorded at the time they were applied.
+    """
+    global bytes_since_snapshot, last_history_time
+    if HISTORY_LOG is None or not changes:
+        return
+    with HISTORY_LOCK:
+        now = time.time()
+        if times:
+            stamped = sorted((min(times.get(item_id, now), now), item_id, quantity) for item_id, quantity in changes)
+        else:
+            stamped = [(now, item_id, quantity) for item_id, quantity in changes]
+        lines = []
+        for when, item_id, quantity in stamped:
+            last_history_time = max(when, last_history_time)
+            lines.append(json.dumps({'t': last_history_time, 'id': item_id, 'q': quantity}).encode('utf-8') + b'\n')
+        lines = b''.join(lines)
+        HISTORY_LOG.write(lines)
+        bytes_since_snapshot += len(lines)
+        if bytes_since_snapshot > max(snapshot_bytes, HISTORY_SNAPSHOT_MIN_BYTES):
+            write_history_snapshot()
+        HISTORY_LOG.flush()
+
+def inventory_at(when):
+    """
+    Returns {item_id: quantity} as it was at Unix time 'when', or None if 'when'
+    is before the history starts.
+    """
+    i = bisect.bisect_right(SNAPSHOT_TIMES, when) - 1
+    if i < 0:
+        return None
+    quantities = {}
+    for entry in read_history(SNAPSHOT_OFFSETS[i]):
+        if entry['t'] > when:
+            break
+        if 'snapshot' in entry:
+            quantities = {int(item_id): quantity for item_id, quantity in entry['snapshot'].items()}
+        elif entry['q'] is None:
+            quantities.pop(entry['id'], None)
+        else:
+            quantities[entry['id']] = entry['q']
+    return quantities
+
+def quantity_at(item_id, when):
+    """An item's quantity at Unix time 'when', or None if it did not exist then (or history had not started)."""
+    quantities = inventory_at(when)
+    return None if quantities is None else quantities.get(item_id)
+
+# --- Batch Movements ---
+
+def parse_timestamp(text):
+    """Accepts an ISO 8601 date/time or Unix seconds and returns Unix seconds."""
+    try:
+        return float(text)
+    except ValueError:
+        return datetime.fromisoformat(text).timestamp()
+
+def read_movements(file_name):
+    """
+    Streams (line number, item_id, delta, timestamp) from a CSV movements file with
+    lines of 'item_id,delta,timestamp'. An optional header row is skipped.
+    Malformed lines are yielded with item_id None so the caller can reject them.
+    """
+    with open(file_name, 'r', encoding='utf-8', newline='') as f:
+        for line_number, row in enumerate(csv.reader(f), start=1):
+            if not row or not ''.join(row).strip():
+                continue
+            if line_number == 1 and row[0].strip().lower() in ('item_id', 'id'):
+                continue # Header row
+            try:
+                item_id, delta, timestamp = row
+                yield line_number, int(item_id), int(delta), parse_timestamp(timestamp.strip())
+            except ValueError:
+                yield line_number, None, None, None
+
+def process_movements_file(file_name, chunk_size=MOVEMENT_CHUNK_SIZE):
+    """
+    Applies a movements file without any prompts. Movements are read in chunks;
+    the deltas for the same item within a chunk are added together first, and
+    each chunk is then applied completely or not at all. The stock history
+    records each item's new quantity at the time of its latest movement in the
+    chunk, so history queries follow the file's timestamps.
+    """
+    if not os.path.exists(file_name):
+        print(f"[ERROR] Movements file {file_name} not found.")
+        return
+
+    applied = 0
+    rejected = 0
+    chunk_number = 0
+    start_time = time.perf_counter()
+    movements = read_movements(file_name)
+    while True:
+        chunk = list(itertools.islice(movements, chunk_size))
+        if not chunk:
+            break
+        chunk_number += 1
+
+        deltas = defaultdict(int)
+        times = {} # Item ID -> time of its latest movement in the chunk
+        bad_lines = [line_number for line_number, item_id, _, _ in chunk if item_id is None]
+        for _, item_id, delta, timestamp in chunk:
+            if item_id is not None:
+                deltas[item_id] += delta
+                times[item_id] = max(times.get(item_id, timestamp), timestamp)
+
+        try:
+            if bad_lines:
+                raise StockError(f"Malformed line(s) {', '.join(map(str, bad_lines[:5]))}.")
+            apply_movements(deltas, times)
+            applied += len(chunk)
+        except StockError as e:
+            rejected += len(chunk)
+            print(f"[ERROR] Chunk {chunk_number} (lines {chunk[0][0]}-{chunk[-1][0]}) rejected: {e}")
+
+    elapsed = time.perf_counter() - start_time
+    rate = applied / elapsed if elapsed > 0 else 0
+    print(f"[INFO] Applied {applied} movements in {elapsed:.2f}s ({rate:,.0f} movements/sec).")
+    if rejected:
+        print(f"[WARNING] Rejected {rejected} movements in chunks that could not be applied.")
+
+def benchmark_stock_api(max_threads=8, operations=40000, item_count=1000):
+    """
+    Measures adjust_quantity throughput with 1, 2, 4, ... max_threads worker
+    threads on both backends, and checks that no update was lost. SQLiteStorage
+    serialises every call, so its rate is not expected to grow with threads.
+    """
+    global INVENTORY
+    saved_inventory = INVENTORY
+    thread_counts = [1]
+    while thread_counts[-1] * 2 <= max_threads:
+        thread_counts.append(thread_counts[-1] * 2)
+
+    print("{:<8} {:>8} {:>14} {:>12}".format("Backend", "Threads", "Movements/sec", "Consistent"))
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            for backend in ("memory", "sqlite"):
+                for threads in thread_counts:
+                    if backend == "memory":
+                        INVENTORY = MemoryStorage()
+                    else:
+                        INVENTORY = SQLiteStorage(f"{folder}/bench_{threads}.db")
+                    item_ids = [INVENTORY.add(f"Item {i}", 1000)['id'] for i in range(item_count)]
+                    INVENTORY.commit()
+
+                    def worker(seed, count):
+                        rng = random.Random(seed)
+                        for _ in range(count // 2):
+                            item_id = rng.choice(item_ids)
+                            adjust_quantity(item_id, 1)
+                            adjust_quantity(item_id, -1)
+
+                    start = time.perf_counter()
+                    with ThreadPoolExecutor(max_workers=threads) as pool:
+                        futures = [pool.submit(worker, seed, operations // threads) for seed in range(threads)]
+                        for future in futures:
+                            future.result() # Re-raises any error from a worker
+                    elapsed = time.perf_counter() - start
+                    INVENTORY.commit()
+
+                    # Every +1 was matched by a -1, so all items must be back at 1000
+                    consistent = all(item['quantity'] == 1000 for item in INVENTORY.all())
+                    print("{:<8} {:>8} {:>14,.0f} {:>12}".format(
+                        backend, threads, operations / elapsed, "yes" if consistent else "NO"))
+                    INVENTORY.close()
+    finally:
+        INVENTORY = saved_inventory
 
 def display_menu():
     """Prints the main menu options to the console."""
@@ -8,29 +806,103 @@ def display_menu():
     print("="*40)
     print("1. Add New Item (Create)")
     print("2. View All Inventory (Read)")
-    print("3. Update Item Name or Quantity (Update)")
+    print("3. Update Item Name, Quantity or Reorder Level (Update)")
     print("4. Delete Item (Delete)")
-    print("5. Exit")
+    print("5. Find Items by Name")
+    print("6. Low Stock Report")
+    print("7. Stock History")
+    print("8. Exit")
     print("="*40)
 
 def view_inventory():
     """Displays all items in the inventory with their details."""
-    if not INVENTORY:
+    if INVENTORY.is_empty():
         print("\n[INFO] The inventory is currently empty.")
         return
 
-    print("\n--- Current Inventory ---")
-    print("{:<5} {:<10} {}".format("ID", "Quantity", "Item Name"))
-    print("-" * 40)
+    print_items("Current Inventory", INVENTORY.all())
 
-    for item in INVENTORY:
-        print(f"{item['id']:<5} {item['quantity']:<10} {item['name']}")
+def print_items(heading, items):
+    """Prints a table of items under the given heading."""
+    print(f"\n--- {heading} ---")
+    print("{:<5} {:<10} {:<10} {:<10} {}".format("ID", "Quantity", "Reserved", "Reorder At", "Item Name"))
+    print("-" * 61)
 
-    print("-" * 40)
+    for item in items:
+        print(f"{item['id']:<5} {item['quantity']:<10} {item['reserved']:<10} {item['reorder_level']:<10} {item['name']}")
+
+    print("-" * 61)
+
+def find_items():
+    """Lists the items whose name starts with the text the user types (any case)."""
+    prefix = input("Enter the start of the item name: ").strip()
+    if not prefix:
+        print("\n[ERROR] Search text cannot be empty.")
+        return
+
+    matches = INVENTORY.find_by_name(prefix)
+    if matches:
+        print_items(f"Items Starting With '{prefix}'", matches)
+    else:
+        print(f"\n[INFO] No items start with '{prefix}'.")
+
+def low_stock_report():
+    """Lists the items below their reorder level, or below a limit the user chooses."""
+    text = input("Show items with quantity below (leave blank for items below their reorder level): ").strip()
+    if not text:
+        items = low_stock_items()
+        if items:
+            print_items("Items Below Their Reorder Level", items)
+        else:
+            print("\n[INFO] No items are below their reorder level.")
+        return
+
+    try:
+        limit = int(text)
+    except ValueError:
+        print("\n[ERROR] Invalid input. Please enter a whole number.")
+        return
+
+    items = INVENTORY.items_below(limit)
+    if items:
+        print_items(f"Items With Quantity Below {limit}", items)
+    else:
+        print(f"\n[INFO] No items have a quantity below {limit}.")
+
+def stock_history():
+    """Shows the quantity of one item, or of every item, at an earlier date and time."""
+    text = input("Enter the item ID (leave blank for the whole inventory): ").strip()
+    try:
+        item_id = int(text) if text else None
+    except ValueError:
+        print("\n[ERROR] Invalid ID. Please enter a number.")
+        return
+    when_text = input("Enter the date and time (e.g. 2024-05-01 14:30): ").strip()
+    try:
+        when = parse_timestamp(when_text)
+    except ValueError:
+        print("\n[ERROR] Invalid date. Use the format YYYY-MM-DD HH:MM.")
+        return
+
+    quantities = inventory_at(when)
+    if quantities is None:
+        print(f"\n[INFO] No history was recorded before {when_text}.")
+    elif item_id is not None:
+        if item_id in quantities:
+            print(f"\n[INFO] Item ID {item_id} had a quantity of {quantities[item_id]} at {when_text}.")
+        else:
+            print(f"\n[INFO] Item ID {item_id} did not exist at {when_text}.")
+    else:
+        print(f"\n--- Inventory As Of {when_text} ---")
+        print("{:<5} {:<10} {}".format("ID", "Quantity", "Item Name"))
+        print("-" * 40)
+        for item_id, quantity in sorted(quantities.items()):
+            item = INVENTORY.get(item_id)
+            print(f"{item_id:<5} {quantity:<10} {item['name'] if item else '(deleted)'}")
+        print("-" * 40)
 
 def add_item():
     """Prompts the user for item details and adds it to the inventory."""
-    global next_id
     item_name = input("Enter the NAME of the new item: ").strip()
     
     if not item_name:
@@ -46,26 +918,29 @@ def add_item():
         print("\n[ERROR] Invalid quantity. Please enter a whole number.")
         return
 
-    new_item = {
-        'id': next_id,
-        'name': item_name,
-        'quantity': quantity
-    }
-    INVENTORY.append(new_item)
-    print(f"\n[SUCCESS] Item '{item_name}' (ID: {next_id}, Qty: {quantity}) added to inventory.")
-    next_id += 1
+    try:
+        text = input("Enter the REORDER LEVEL (leave blank for no low-stock alerts): ").strip()
+        reorder_level = int(text) if text else 0
+        if reorder_level < 0:
+            print("\n[ERROR] Reorder level must be zero or a positive number.")
+            return
+    except ValueError:
+        print("\n[ERROR] Invalid reorder level. Please enter a whole number.")
+        return
+
+    new_item = INVENTORY.add(item_name, quantity, reorder_level)
+    print(f"\n[SUCCESS] Item '{item_name}' (ID: {new_item['id']}, Qty: {quantity}) added to inventory.")
+    with item_lock(new_item['id']):
+        stock_changed([new_item])
 
 def get_item_by_id(item_id):
-    """Helper function to find an item by its unique ID."""
-    for item in INVENTORY:
-        if item['id'] == item_id:
-            return item
-    return None
+    """Helper function to find an item by its unique ID (an indexed lookup in either backend)."""
+    return INVENTORY.get(item_id)
 
 def update_item():
-    """Allows the user to modify an item's name or quantity."""
+    """Allows the user to modify an item's name, quantity or reorder level."""
     view_inventory()
-    if not INVENTORY:
+    if INVENTORY.is_empty():
         return
 
     try:
@@ -80,25 +955,34 @@ def update_item():
         print(f"\nEditing Item ID: {item_id} ('{item_to_update['name']}', Qty: {item_to_update['quantity']})")
         print("1. Change Item Name")
         print("2. Change Quantity")
-        choice = input("Enter your choice (1 or 2): ")
+        print("3. Change Reorder Level")
+        choice = input("Enter your choice (1, 2 or 3): ")
 
         if choice == '1':
             new_name = input("Enter the new item name: ").strip()
             if new_name:
-                item_to_update['name'] = new_name
+                INVENTORY.update(item_id, name=new_name)
                 print(f"\n[SUCCESS] Item ID {item_id} name updated to '{new_name}'.")
             else:
                 print("\n[ERROR] Name cannot be empty. No change made.")
         elif choice == '2':
             try:
                 new_quantity = int(input("Enter the new quantity: "))
-                if new_quantity >= 0:
-                    item_to_update['quantity'] = new_quantity
-                    print(f"\n[SUCCESS] Item ID {item_id} quantity updated to {new_quantity}.")
-                else:
-                    print("\n[ERROR] Quantity must be zero or a positive number.")
+                set_quantity(item_id, new_quantity)
+                print(f"\n[SUCCESS] Item ID {item_id} quantity updated to {new_quantity}.")
             except ValueError:
                 print("\n[ERROR] Invalid input. Please enter a whole number for quantity.")
+            except StockError as e:
+                print(f"\n[ERROR] {e}")
+        elif choice == '3':
+            try:
+                new_level = int(input("Enter the new reorder level (0 for no alerts): "))
+                set_reorder_level(item_id, new_level)
+                print(f"\n[SUCCESS] Item ID {item_id} reorder level updated to {new_level}.")
+            except ValueError:
+                print("\n[ERROR] Invalid input. Please enter a whole number for the reorder level.")
+            except StockError as e:
+                print(f"\n[ERROR] {e}")
         else:
             print("\n[ERROR] Invalid choice.")
     else:
@@ -108,7 +992,7 @@ def update_item():
 def delete_item():
     """Prompts the user for an item ID and removes it from the inventory."""
     view_inventory()
-    if not INVENTORY:
+    if INVENTORY.is_empty():
         return
 
     try:
@@ -120,7 +1004,7 @@ def delete_item():
     item_to_delete = get_item_by_id(item_id)
 
     if item_to_delete:
-        INVENTORY.remove(item_to_delete)
+        remove_item(item_id)
         print(f"\n[SUCCESS] Item ID {item_id} ('{item_to_delete['name']}') deleted from inventory.")
     else:
         print(f"\n[ERROR] Item with ID {item_id} not found.")
@@ -128,11 +1012,15 @@ def delete_item():
 
 def main():
     """The main application loop."""
+    global INVENTORY
     print("Welcome to the Console Inventory Manager!")
+    INVENTORY = open_storage()
+    load_low_stock()
+    open_history()
 
     while True:
         display_menu()
-        choice = input("Enter your option (1-5): ").strip()
+        choice = input("Enter your option (1-8): ").strip()
 
         if choice == '1':
             add_item()
@@ -143,12 +1031,40 @@ def main():
         elif choice == '4':
             delete_item()
         elif choice == '5':
+            find_items()
+        elif choice == '6':
+            low_stock_report()
+        elif choice == '7':
+            stock_history()
+        elif choice == '8':
+            close_history()
+            INVENTORY.close() # Commits any writes still waiting in the current batch
             print("\nThank you for using the Inventory Manager. Goodbye!")
             break
         else:
-            print("\n[ERROR] Invalid choice. Please enter a number between 1 and 5.")
+            print("\n[ERROR] Invalid choice. Please enter a number between 1 and 8.")
+
+        # Make each completed action durable; bulk callers batch many writes per commit instead
+        INVENTORY.commit()
 
 
 # --- Execution Block ---
 if __name__ == "__main__":
-    main()
+    # python "CRUD(inventorymanagement).py" --benchmark [max_threads] measures the stock movement API
+    # python "CRUD(inventorymanagement).py" --apply-movements FILE applies a movements file in batch mode
+    if len(sys.argv) == 3 and sys.argv[1] == '--apply-movements':
+        INVENTORY = open_storage()
+        load_low_stock()
+        open_history()
+        process_movements_file(sys.argv[2])
+        close_history()
+        INVENTORY.close()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        try:
+            max_threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+        except ValueError:
+            max_threads = 8
+            print("Invalid thread count. Using 8.")
+        benchmark_stock_api(max_threads)
+    else:
+        main()
@@ -1,5 +1,269 @@
-TASKS = []
+import os
+import sys
+import json
+import time
+import heapq
+import random
+import tempfile
+from io import StringIO
+from datetime import date
+from contextlib import redirect_stdout
+
+TASKS_FILE = "tasks.log" # Every change is appended here and replayed when the app starts
+TASKS = {} # Task ID -> task dict, in the order the tasks were added
+OPEN_TASKS = {} # The tasks not yet done (task ID -> task dict)
+DONE_TASKS = {} # The tasks marked as done (task ID -> task dict)
+TASKS_LOG = None # Append handle on TASKS_FILE, opened by load_tasks()
+SYNC_CHANGES = True # Flush and fsync TASKS_FILE after every change (command mode syncs once at the end instead)
+COMPACT_TOMBSTONE_RATIO = 0.5 # Rewrite TASKS_FILE once this share of its lines are deletes or outdated copies
+COMPACT_MIN_RECORDS = 1000 # ...but never bother for a log shorter than this
+log_records = 0 # Lines currently in TASKS_FILE
 next_id = 1
+PRIORITY_NAMES = {1: "High", 2: "Medium", 3: "Low"}
+SCHEDULE = [] # Heap of (due, priority, task ID) for the open tasks, see the Schedule section
+SCHEDULED = {} # Task ID -> its current entry in SCHEDULE
+
+# --- Task Store ---
+# Every task is in TASKS and in exactly one of OPEN_TASKS or DONE_TASKS, so
+# looking a task up, toggling its status and listing only the open tasks are all
+# dict operations that never walk the completed ones. Changes are written to
+# TASKS_FILE as JSON lines: {"op": "put", "task": {...}} for a new or changed
+# task and {"op": "delete", "id": ...} for a deleted one. A delete is therefore
+# only a tombstone line in the log; once tombstones and outdated copies make up
+# COMPACT_TOMBSTONE_RATIO of the file, it is rewritten with just the live tasks.
+
+def store_task(task):
+    """Adds or replaces a task in TASKS and in the partition that matches its status."""
+    task.setdefault('priority', None) # Tasks logged before priorities and due dates existed
+    task.setdefault('due', None)
+    schedule_task(task)
+    TASKS[task['id']] = task
+    if task['done']:
+        OPEN_TASKS.pop(task['id'], None)
+        DONE_TASKS[task['id']] = task
+    else:
+        DONE_TASKS.pop(task['id'], None)
+        OPEN_TASKS[task['id']] = task
+
+def discard_task(task_id):
+    """Removes a task from TASKS and from its partition."""
+    task = TASKS.pop(task_id, None)
+    if task is not None:
+        (DONE_TASKS if task['done'] else OPEN_TASKS).pop(task_id, None)
+        SCHEDULED.pop(task_id, None)
+    return task
+
+def load_tasks():
+    """Rebuilds the task store by replaying TASKS_FILE, then opens it for appending."""
+    global TASKS_LOG, next_id, log_records
+    cut_short = False
+    log_records = 0
+    if os.path.exists(TASKS_FILE):
+        with open(TASKS_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                cut_short = not line.endswith("\n")
+                log_records += 1
+                try:
+                    entry = json.loads(line)
+                    if entry['op'] == 'next_id': # Written by compact_tasks()
+                        next_id = max(next_id, entry['value'])
+                    elif entry['op'] == 'put':
+                        store_task(entry['task'])
+                        next_id = max(next_id, entry['task']['id'] + 1)
+                    elif entry['op'] == 'delete':
+                        discard_task(entry['id'])
+                        next_id = max(next_id, entry['id'] + 1) # Never reuse a deleted task's ID
+                except (ValueError, KeyError, TypeError):
+                    continue # Half-written line from a crash
+        print(f"[INFO] Loaded {len(TASKS)} tasks ({len(OPEN_TASKS)} open) from {TASKS_FILE}.")
+    TASKS_LOG = open(TASKS_FILE, 'a', encoding='utf-8')
+    if cut_short:
+        TASKS_LOG.write("\n") # Start on a fresh line after a half-written last line
+    compact_if_needed()
+
+def log_change(entry):
+    """Appends one change to TASKS_FILE and, if SYNC_CHANGES is on, forces it to disk."""
+    global log_records
+    TASKS_LOG.write(json.dumps(entry) + "\n")
+    if SYNC_CHANGES:
+        sync_tasks()
+    log_records += 1
+    compact_if_needed()
+
+def sync_tasks():
+    """Forces every logged change to disk."""
+    TASKS_LOG.flush()
+    os.fsync(TASKS_LOG.fileno())
+
+def compact_if_needed():
+    """Compacts TASKS_FILE when too much of it is tombstones and outdated copies."""
+    dead_records = log_records - len(TASKS)
+    if log_records >= COMPACT_MIN_RECORDS and dead_records > log_records * COMPACT_TOMBSTONE_RATIO:
+        compact_tasks()
+
+def compact_tasks():
+    """
+    Rewrites TASKS_FILE with one line per live task. The new file is written
+    next to the old one and swapped in with os.replace, so a crash leaves either
+    the old log or the new one, never half of each.
+    """
+    global TASKS_LOG, log_records
+    start_time = time.perf_counter()
+    temp_name = TASKS_FILE + ".tmp"
+    with open(temp_name, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'op': 'next_id', 'value': next_id}) + "\n") # Keeps deleted IDs from being reused
+        for task in TASKS.values():
+            f.write(json.dumps({'op': 'put', 'task': task}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    TASKS_LOG.close()
+    os.replace(temp_name, TASKS_FILE)
+    TASKS_LOG = open(TASKS_FILE, 'a', encoding='utf-8')
+    removed = max(0, log_records - len(TASKS) - 1)
+    log_records = len(TASKS) + 1
+    print(f"[INFO] Compacted {TASKS_FILE}: dropped {removed} old lines "
+          f"in {time.perf_counter() - start_time:.2f}s.")
+
+def create_task(description, priority=None, due=None):
+    """Adds a new open task with the next free ID and returns it."""
+    global next_id
+    new_task = {
+        'id': next_id,
+        'description': description,
+        'done': False,
+        'priority': priority,
+        'due': due
+    }
+    next_id += 1
+    save_task(new_task)
+    return new_task
+
+def save_task(task):
+    """Stores a new or changed task and logs it."""
+    store_task(task)
+    log_change({'op': 'put', 'task': task})
+
+def remove_task(task_id):
+    """Deletes a task and logs the deletion. Returns the deleted task, or None."""
+    task = discard_task(task_id)
+    if task is not None:
+        log_change({'op': 'delete', 'id': task_id})
+    return task
+
+# --- Schedule ---
+# SCHEDULE is a heap of the open tasks ordered by due date, then priority, then
+# ID (tasks without a due date or priority come last). When a task changes, a
+# new entry is pushed and SCHEDULED points at it; the old entry stays in the heap
+# and is simply skipped when it comes to the top. So the first k tasks can be
+# found by popping k entries (O(k log n)) instead of sorting every task.
+
+def schedule_key(task):
+    """The (due, priority, id) heap key of a task."""
+    due = date.fromisoformat(task['due']).toordinal() if task['due'] else float('inf')
+    priority = task['priority'] if task['priority'] else len(PRIORITY_NAMES) + 1
+    return (due, priority, task['id'])
+
+def schedule_task(task):
+    """Puts an open task in SCHEDULE (replacing its old entry) or takes a done task out."""
+    if task['done']:
+        SCHEDULED.pop(task['id'], None)
+        return
+    entry = schedule_key(task)
+    SCHEDULED[task['id']] = entry
+    heapq.heappush(SCHEDULE, entry)
+    if len(SCHEDULE) > 2 * len(SCHEDULED) + 100:
+        # Mostly old entries now: rebuild from the current ones (O(n), but rare)
+        SCHEDULE[:] = SCHEDULED.values()
+        heapq.heapify(SCHEDULE)
+
+def scheduled_tasks(keep_going):
+    """
+    Pops open tasks from the top of SCHEDULE for as long as keep_going(entry, found)
+    is true (found is how many were taken so far), then pushes them back. Old entries found on the way are dropped.
+    """
+    found = []
+    while SCHEDULE:
+        entry = SCHEDULE[0]
+        if SCHEDULED.get(entry[2]) is not entry:
+            heapq.heappop(SCHEDULE) # Left behind by an update, delete or toggle
+            continue
+        if not keep_going(entry, len(found)):
+            break
+        found.append(heapq.heappop(SCHEDULE))
+    for entry in found:
+        heapq.heappush(SCHEDULE, entry)
+    return [TASKS[entry[2]] for entry in found]
+
+def next_tasks(count):
+    """The 'count' open tasks to work on next: earliest due date first, then highest priority."""
+    return scheduled_tasks(lambda entry, found: found < count)
+
+def overdue_tasks(today=None):
+    """The open tasks whose due date is before today, most overdue first."""
+    today = (today or date.today()).toordinal()
+    return scheduled_tasks(lambda entry, found: entry[0] < today)
+
+def close_tasks():
+    global TASKS_LOG
+    if TASKS_LOG is not None:
+        TASKS_LOG.close()
+        TASKS_LOG = None
+
+def benchmark_deletes(total=1_000_000, deletes=100_000, list_sample=200):
+    """
+    Deletes 'deletes' random tasks out of 'total', once through the task store
+    and once the old way (a linear get_task_by_id scan plus list.remove on a
+    plain list). The old way is timed on the first 'list_sample' deletes and
+    scaled up, since running it in full would take hours.
+    """
+    global TASKS_FILE, SYNC_CHANGES
+    saved_settings = (TASKS_FILE, SYNC_CHANGES)
+    rng = random.Random(42)
+    victims = rng.sample(range(1, total + 1), deletes)
+
+    print(f"[INFO] Deleting {deletes:,} of {total:,} tasks...")
+    with tempfile.TemporaryDirectory() as folder:
+        TASKS_FILE = os.path.join(folder, "bench_tasks.log")
+        SYNC_CHANGES = False # Measure the data structure and log writes, not the disk's fsync speed
+        try:
+            load_tasks()
+            for task_id in range(1, total + 1):
+                store_task({'id': task_id, 'description': f"Benchmark task {task_id}", 'done': task_id % 3 == 0,
+                            'priority': None, 'due': None})
+            compact_tasks() # Writes the starting log: one line per task
+            start = time.perf_counter()
+            for task_id in victims:
+                remove_task(task_id)
+            store_time = time.perf_counter() - start
+            TASKS_LOG.flush()
+            log_size = os.path.getsize(TASKS_FILE)
+            start = time.perf_counter()
+            compact_tasks()
+            compact_time = time.perf_counter() - start
+            print(f"[INFO] Log shrank from {log_size:,} to {os.path.getsize(TASKS_FILE):,} bytes.")
+        finally:
+            close_tasks()
+            TASKS.clear()
+            OPEN_TASKS.clear()
+            DONE_TASKS.clear()
+            SCHEDULE.clear()
+            SCHEDULED.clear()
+            TASKS_FILE, SYNC_CHANGES = saved_settings
+
+    task_list = [{'id': task_id, 'description': f"Benchmark task {task_id}", 'done': False}
+                 for task_id in range(1, total + 1)]
+    start = time.perf_counter()
+    for task_id in victims[:list_sample]:
+        task = next(task for task in task_list if task['id'] == task_id)
+        task_list.remove(task)
+    list_time = (time.perf_counter() - start) * deletes / list_sample
+
+    print("{:<32} {:>12} {:>14}".format("Method", "Time", "Deletes/sec"))
+    print("{:<32} {:>11.2f}s {:>14,.0f}".format("Task store (tombstone in log)", store_time, deletes / store_time))
+    print("{:<32} {:>11.2f}s {:>14}".format("Compaction afterwards", compact_time, "-"))
+    print("{:<32} {:>11.0f}s {:>14,.0f}".format("list.remove (estimated)", list_time, deletes / list_time))
+
+# --- Menu Functions ---
 
 def display_menu():
     """Prints the main menu options to the console."""
@@ -8,9 +272,12 @@ def display_menu():
     print("="*40)
     print("1. Add New Task (Create)")
     print("2. View All Tasks (Read)")
-    print("3. Update Task Description/Status (Update)")
+    print("3. Update Task Description/Status/Priority/Due Date (Update)")
     print("4. Delete Task (Delete)")
-    print("5. Exit")
+    print("5. View Open Tasks")
+    print("6. Next Tasks To Work On")
+    print("7. Overdue Tasks")
+    print("8. Exit")
     print("="*40)
 
 def view_tasks():
@@ -19,41 +286,94 @@ def view_tasks():
         print("\n[INFO] The task list is currently empty.")
         return
 
-    print("\n--- Current Tasks ---")
-    print("{:<5} {:<6} {}".format("ID", "Status", "Description"))
-    print("-" * 35)
+    print_tasks("Current Tasks", TASKS.values())
+
+def view_open_tasks():
+    """Displays only the tasks that are not done yet."""
+    if not OPEN_TASKS:
+        print("\n[INFO] There are no open tasks.")
+        return
+
+    print_tasks("Open Tasks", OPEN_TASKS.values())
 
-    for task in TASKS:
+def print_tasks(heading, tasks):
+    """Prints a table of tasks under the given heading."""
+    print(f"\n--- {heading} ---")
+    print("{:<5} {:<6} {:<8} {:<10} {}".format("ID", "Status", "Priority", "Due", "Description"))
+    print("-" * 55)
+
+    for task in tasks:
         status = "[DONE]" if task['done'] else "[TODO]"
-        print(f"{task['id']:<5} {status:<6} {task['description']}")
+        priority = PRIORITY_NAMES.get(task['priority'], "-")
+        print(f"{task['id']:<5} {status:<6} {priority:<8} {task['due'] or '-':<10} {task['description']}")
+
+    print("-" * 55)
+
+def view_next_tasks():
+    """Shows the open tasks to work on next, by due date and priority."""
+    text = input("How many tasks? (leave blank for 5): ").strip()
+    try:
+        count = int(text) if text else 5
+    except ValueError:
+        print("\n[ERROR] Invalid number. Please enter a whole number.")
+        return
 
-    print("-" * 35)
+    tasks = next_tasks(count)
+    if tasks:
+        print_tasks("Next Tasks To Work On", tasks)
+    else:
+        print("\n[INFO] There are no open tasks.")
+
+def view_overdue_tasks():
+    """Shows the open tasks that are past their due date."""
+    tasks = overdue_tasks()
+    if tasks:
+        print_tasks("Overdue Tasks", tasks)
+    else:
+        print("\n[INFO] No tasks are overdue.")
+
+def ask_priority():
+    """Asks for a priority. Returns 1-3, None for no priority, or False if the input is invalid."""
+    text = input("Enter the priority (1 = High, 2 = Medium, 3 = Low, leave blank for none): ").strip()
+    if not text:
+        return None
+    if text in ('1', '2', '3'):
+        return int(text)
+    print("\n[ERROR] Priority must be 1, 2 or 3.")
+    return False
+
+def ask_due_date():
+    """Asks for a due date. Returns 'YYYY-MM-DD', None for no due date, or False if the input is invalid."""
+    text = input("Enter the due date (YYYY-MM-DD, leave blank for none): ").strip()
+    if not text:
+        return None
+    try:
+        return date.fromisoformat(text).isoformat()
+    except ValueError:
+        print("\n[ERROR] Invalid date. Please use the format YYYY-MM-DD.")
+        return False
 
 def add_task():
     """Prompts the user for a task description and adds it to the list."""
-    global next_id
     description = input("Enter the description for the new task: ").strip()
     if description:
-        new_task = {
-            'id': next_id,
-            'description': description,
-            'done': False
-        }
-        TASKS.append(new_task)
-        print(f"\n[SUCCESS] Task '{description}' (ID: {next_id}) added.")
-        next_id += 1
+        priority = ask_priority()
+        if priority is False:
+            return
+        due = ask_due_date()
+        if due is False:
+            return
+        new_task = create_task(description, priority, due)
+        print(f"\n[SUCCESS] Task '{description}' (ID: {new_task['id']}) added.")
     else:
         print("\n[ERROR] Task description cannot be empty.")
 
 def get_task_by_id(task_id):
-    """Helper function to find a task by its unique ID."""
-    for task in TASKS:
-        if task['id'] == task_id:
-            return task
-    return None
+    """Helper function to find a task by its unique ID (a dict lookup)."""
+    return TASKS.get(task_id)
 
 def update_task():
-    """Allows the user to modify a task's description or mark it as done/undone."""
+    """Allows the user to modify a task's description, priority or due date, or mark it as done/undone."""
     view_tasks()
     if not TASKS:
         return
@@ -70,19 +390,35 @@ def update_task():
         print(f"\nEditing Task ID: {task_id} ('{task_to_update['description']}')")
         print("1. Change description")
         print("2. Toggle status (Done/To-Do)")
-        choice = input("Enter your choice (1 or 2): ")
+        print("3. Change priority")
+        print("4. Change due date")
+        choice = input("Enter your choice (1-4): ")
 
         if choice == '1':
             new_description = input("Enter the new description: ").strip()
             if new_description:
                 task_to_update['description'] = new_description
+                save_task(task_to_update)
                 print(f"\n[SUCCESS] Task ID {task_id} description updated.")
             else:
                 print("\n[ERROR] Description cannot be empty. No change made.")
         elif choice == '2':
             task_to_update['done'] = not task_to_update['done']
+            save_task(task_to_update) # Moves it to the other partition
             status = "DONE" if task_to_update['done'] else "TO-DO"
             print(f"\n[SUCCESS] Task ID {task_id} status changed to {status}.")
+        elif choice == '3':
+            priority = ask_priority()
+            if priority is not False:
+                task_to_update['priority'] = priority
+                save_task(task_to_update) # Re-schedules it
+                print(f"\n[SUCCESS] Task ID {task_id} priority updated.")
+        elif choice == '4':
+            due = ask_due_date()
+            if due is not False:
+                task_to_update['due'] = due
+                save_task(task_to_update)
+                print(f"\n[SUCCESS] Task ID {task_id} due date updated.")
         else:
             print("\n[ERROR] Invalid choice.")
     else:
@@ -101,10 +437,9 @@ def delete_task():
         print("\n[ERROR] Invalid ID. Please enter a number.")
         return
 
-    task_to_delete = get_task_by_id(task_id)
+    task_to_delete = remove_task(task_id)
 
     if task_to_delete:
-        TASKS.remove(task_to_delete)
         print(f"\n[SUCCESS] Task ID {task_id} ('{task_to_delete['description']}') deleted.")
     else:
         print(f"\n[ERROR] Task with ID {task_id} not found.")
@@ -113,10 +448,11 @@ def delete_task():
 def main():
     """The main application loop."""
     print("Welcome to the Console Task Manager!")
+    load_tasks()
 
     while True:
         display_menu()
-        choice = input("Enter your option (1-5): ").strip()
+        choice = input("Enter your option (1-8): ").strip()
 
         if choice == '1':
             add_task()
@@ -127,12 +463,165 @@ def main():
         elif choice == '4':
             delete_task()
         elif choice == '5':
+            view_open_tasks()
+        elif choice == '6':
+            view_next_tasks()
+        elif choice == '7':
+            view_overdue_tasks()
+        elif choice == '8':
+            close_tasks()
             print("\nThank you for using the Task Manager. Goodbye!")
             break
         else:
-            print("\n[ERROR] Invalid choice. Please enter a number between 1 and 5.")
+            print("\n[ERROR] Invalid choice. Please enter a number between 1 and 8.")
+
+
+# --- Command Mode ---
+# Runs newline-separated commands without the menu, for scripts:
+#   add DESCRIPTION              update ID DESCRIPTION     toggle ID
+#   delete ID                    priority ID 1-3|none      due ID YYYY-MM-DD|none
+#   list [all|open|done]         next [N]                  overdue
+# Blank lines and lines starting with '#' are skipped. All output is collected
+# and written in one go at the end, and the log is fsynced once, not per change.
+
+def command_task(args):
+    """Splits 'ID rest' and returns (task, rest), raising ValueError if there is no such task."""
+    task_id, _, rest = args.partition(' ')
+    try:
+        task = TASKS.get(int(task_id))
+    except ValueError:
+        raise ValueError(f"Invalid ID '{task_id}'.")
+    if task is None:
+        raise ValueError(f"Task with ID {task_id} not found.")
+    return task, rest.strip()
+
+def command_add(args):
+    if not args:
+        raise ValueError("Task description cannot be empty.")
+    new_task = create_task(args)
+    print(f"[SUCCESS] Task '{args}' (ID: {new_task['id']}) added.")
 
+def command_update(args):
+    task, description = command_task(args)
+    if not description:
+        raise ValueError("Description cannot be empty.")
+    task['description'] = description
+    save_task(task)
+    print(f"[SUCCESS] Task ID {task['id']} description updated.")
+
+def command_toggle(args):
+    task, _ = command_task(args)
+    task['done'] = not task['done']
+    save_task(task)
+    print(f"[SUCCESS] Task ID {task['id']} status changed to {'DONE' if task['done'] else 'TO-DO'}.")
+
+def command_delete(args):
+    task, _ = command_task(args)
+    remove_task(task['id'])
+    print(f"[SUCCESS] Task ID {task['id']} ('{task['description']}') deleted.")
+
+def command_priority(args):
+    task, value = command_task(args)
+    if value.lower() not in ('1', '2', '3', 'none'):
+        raise ValueError("Priority must be 1, 2, 3 or none.")
+    task['priority'] = None if value.lower() == 'none' else int(value)
+    save_task(task)
+    print(f"[SUCCESS] Task ID {task['id']} priority updated.")
+
+def command_due(args):
+    task, value = command_task(args)
+    try:
+        task['due'] = None if value.lower() == 'none' else date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError("Due date must be YYYY-MM-DD or none.")
+    save_task(task)
+    print(f"[SUCCESS] Task ID {task['id']} due date updated.")
+
+def command_list(args):
+    which = args.lower() or 'all'
+    if which == 'all':
+        print_tasks("Current Tasks", TASKS.values())
+    elif which == 'open':
+        print_tasks("Open Tasks", OPEN_TASKS.values())
+    elif which == 'done':
+        print_tasks("Done Tasks", DONE_TASKS.values())
+    else:
+        raise ValueError("Use 'list', 'list open' or 'list done'.")
+
+def command_next(args):
+    try:
+        count = int(args) if args else 5
+    except ValueError:
+        raise ValueError(f"Invalid number '{args}'.")
+    print_tasks("Next Tasks To Work On", next_tasks(count))
+
+def command_overdue(args):
+    print_tasks("Overdue Tasks", overdue_tasks())
+
+COMMANDS = {
+    'add': command_add,
+    'update': command_update,
+    'toggle': command_toggle,
+    'delete': command_delete,
+    'priority': command_priority,
+    'due': command_due,
+    'list': command_list,
+    'next': command_next,
+    'overdue': command_overdue,
+}
+
+def run_commands(lines):
+    """Runs commands from an iterable of lines and writes all of their output at the end."""
+    global SYNC_CHANGES
+    output = StringIO()
+    count = 0
+    errors = 0
+    start_time = time.perf_counter()
+    SYNC_CHANGES = False
+    try:
+        with redirect_stdout(output):
+            load_tasks()
+            for line_number, line in enumerate(lines, start=1):
+                command, _, args = line.strip().partition(' ')
+                if not command or command.startswith('#'):
+                    continue
+                count += 1
+                handler = COMMANDS.get(command.lower())
+                try:
+                    if handler is None:
+                        raise ValueError(f"Unknown command '{command}'.")
+                    handler(args.strip())
+                except ValueError as e:
+                    errors += 1
+                    print(f"[ERROR] Line {line_number}: {e}")
+            sync_tasks() # One fsync for the whole run
+            close_tasks()
+            elapsed = time.perf_counter() - start_time
+            print(f"[INFO] Ran {count} commands in {elapsed:.2f}s ({errors} failed).")
+    finally:
+        SYNC_CHANGES = True
+        sys.stdout.write(output.getvalue())
+        sys.stdout.flush()
 
 # --- Execution Block ---
 if __name__ == "__main__":
-    main()
+    # python "CRUD(todolist).py" --benchmark [total] [deletes] times deleting tasks
+    # python "CRUD(todolist).py" --commands [FILE] runs commands from FILE (or stdin) without the menu
+    if len(sys.argv) > 1 and sys.argv[1] == '--commands':
+        if len(sys.argv) > 2 and sys.argv[2] != '-':
+            try:
+                with open(sys.argv[2], 'r', encoding='utf-8') as f:
+                    run_commands(f)
+            except FileNotFoundError:
+                print(f"[ERROR] Command file {sys.argv[2]} not found.")
+        else:
+            run_commands(sys.stdin)
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        try:
+            sizes = [int(arg) for arg in sys.argv[2:4]]
+        except ValueError:
+            sizes = []
+            print("Invalid sizes. Using 1,000,000 tasks and 100,000 deletes.")
+        benchmark_deletes(*sizes)
+    else:
+        main()
@@ -1,34 +1,347 @@
 import urllib.request
+import urllib.parse
 import re
 import ssl
 import os
+import sys
+import csv
+import html
+import gzip
+import json
+import base64
+import time
+import zlib
+import codecs
+import hashlib
+import tempfile
+import threading
+import tracemalloc
+import urllib.error
+import http.client
+from collections import deque
+from html.parser import HTMLParser
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # NOTE ON CONTEXT:
 # This script uses built-in Python tools. To work on live e-commerce sites like Flipkart/Nykaa, 
-# you MUST inspect the source code of the target website and replace the placeholder class names below.
+# you MUST inspect the source code of the target website and update its class names in scraper_sites.json.
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+FETCH_TIMEOUT = 15 # Seconds before a request is given up
+MAX_WORKERS = 16 # Pages fetched at the same time in batch mode
+MAX_PER_HOST = 4 # ...but never more than this many from one website at once
+USE_CACHE = True # Keep pages in CACHE_DIR and revalidate them instead of downloading them again
+CACHE_DIR = ".scrape_cache"
+CACHE_MAX_BYTES = 100 * 1024 * 1024 # Least recently used pages are deleted beyond this size
+POOL_MAX_IDLE = 8 # Open connections kept per website for the next request
+STREAM_CHUNK_SIZE = 16 * 1024 # Bytes read from the network at a time by the streaming extractor
+MAX_NESTING = 3 # Same-named elements nested inside a title or price that extract_products() can follow
+MAX_REDIRECTS = 5
+
+# Create an unverified context to handle common SSL certificate issues
+SSL_CONTEXT = ssl._create_unverified_context()
+
+# --- Response Cache ---
+# Each cached page is two files in CACHE_DIR, named after a hash of its URL:
+# <key>.html holds the body and <key>.json holds the URL, its ETag/Last-Modified
+# validators and the body size. A file's modification time records when the page
+# was last used, so the least recently used pages can be found again after a
+# restart. Pages are only cached if the server sent a validator, because without
+# one a cached copy could never be confirmed as still current.
+
+CACHE_ENTRIES = None # Key -> metadata dict, least recently used first; loaded on first use
+CACHE_LOCK = threading.Lock()
+CACHE_STATS = {'hits': 0, 'misses': 0, 'bytes_saved': 0}
+cache_bytes = 0
+cache_warned = False # Set once a page could not be saved, so the warning is printed only once
+
+def cache_key(url):
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+def cache_path(key, extension):
+    return os.path.join(CACHE_DIR, key + extension)
+
+def load_cache_index():
+    """Builds CACHE_ENTRIES from the metadata files, oldest use first. Call with CACHE_LOCK held."""
+    global CACHE_ENTRIES, cache_bytes
+    CACHE_ENTRIES = {}
+    cache_bytes = 0
+    if not os.path.isdir(CACHE_DIR):
+        return
+    found = []
+    for name in os.listdir(CACHE_DIR):
+        if not name.endswith('.json'):
+            continue
+        try:
+            path = os.path.join(CACHE_DIR, name)
+            with open(path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            found.append((os.path.getmtime(path), name[:-5], meta))
+        except (OSError, ValueError):
+            continue # Damaged entry, it will simply be fetched again
+    for _, key, meta in sorted(found, key=lambda entry: entry[0]):
+        CACHE_ENTRIES[key] = meta
+        cache_bytes += meta['size']
+
+def cache_lookup(url):
+    """Returns the cached metadata for a URL, or None."""
+    with CACHE_LOCK:
+        if CACHE_ENTRIES is None:
+            load_cache_index()
+        return CACHE_ENTRIES.get(cache_key(url))
+
+def cache_read(url):
+    """Returns the cached body of a URL and marks it as just used."""
+    key = cache_key(url)
+    with open(cache_path(key, '.html'), 'rb') as f:
+        body = f.read()
+    with CACHE_LOCK:
+        meta = CACHE_ENTRIES.pop(key, None)
+        if meta is not None:
+            CACHE_ENTRIES[key] = meta # Move to the most recently used end
+            os.utime(cache_path(key, '.json'))
+    return body
+
+def cache_store(url, body, etag, last_modified):
+    """
+    Saves a page with its validators, then evicts old pages until the cache fits
+    CACHE_MAX_BYTES. Caching is best-effort: if the page cannot be written (disk
+    full, read-only folder), a warning is printed once and the fetch still succeeds.
+    """
+    global cache_bytes, cache_warned
+    key = cache_key(url)
+    meta = {'url': url, 'etag': etag, 'last_modified': last_modified, 'size': len(body)}
+    temp_names = []
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to temporary files first, so a crash never leaves a half-written page.
+        # Each writer gets its own names, so two threads saving the same URL never collide.
+        for data in (body, json.dumps(meta).encode('utf-8')):
+            handle, temp_name = tempfile.mkstemp(prefix=key, suffix='.tmp', dir=CACHE_DIR)
+            temp_names.append(temp_name)
+            with os.fdopen(handle, 'wb') as f:
+                f.write(data)
+        with CACHE_LOCK:
+            # Both files are moved into place together, so the page always matches its metadata
+            os.replace(temp_names[0], cache_path(key, '.html'))
+            os.replace(temp_names[1], cache_path(key, '.json'))
+    except OSError as e:
+        for temp_name in temp_names:
+            try:
+                os.remove(temp_name)
+            except OSError:
+                pass
+        if not cache_warned:
+            cache_warned = True
+            print(f"[WARNING] Could not save pages in {CACHE_DIR} ({e}). Pages are fetched but not cached.")
+        return
+
+    with CACHE_LOCK:
+        if CACHE_ENTRIES is None:
+            load_cache_index()
+        old = CACHE_ENTRIES.pop(key, None)
+        if old is not None:
+            cache_bytes -= old['size']
+        CACHE_ENTRIES[key] = meta
+        cache_bytes += meta['size']
+        while cache_bytes > CACHE_MAX_BYTES and len(CACHE_ENTRIES) > 1:
+            oldest = next(iter(CACHE_ENTRIES))
+            cache_bytes -= CACHE_ENTRIES.pop(oldest)['size']
+            for extension in ('.html', '.json'):
+                try:
+                    os.remove(cache_path(oldest, extension))
+                except OSError:
+                    pass
+
+def cache_summary():
+    """One line describing the cache counters."""
+    return (f"Cache: {CACHE_STATS['hits']} hits, {CACHE_STATS['misses']} misses, "
+            f"{CACHE_STATS['bytes_saved']:,} bytes not downloaded again.")
+
+# --- Connection Pool ---
+# Keeps finished HTTP/1.1 connections open, per website (and proxy), so the next
+# request to the same retailer skips the TCP and TLS handshakes. A connection is
+# taken out of POOL while a request runs on it, so each is used by one thread
+# at a time. Proxies are honoured like urllib does: HTTP_PROXY/HTTPS_PROXY (and
+# NO_PROXY) from the environment or the system settings. Plain HTTP requests are
+# sent to the proxy with the full URL, and HTTPS requests go through a CONNECT
+# tunnel, so the page itself is still encrypted end to end.
+
+POOL = {} # (scheme, host, port, proxy) -> list of idle connections
+POOL_LOCK = threading.Lock()
+PROXY_CHOICES = {} # (scheme, host) -> proxy or None; the settings are read once, as urlopen does
+
+def proxy_for(scheme, host):
+    """Returns the proxy to use for a URL, as urlsplit() parts, or None for a direct connection."""
+    if (scheme, host) not in PROXY_CHOICES:
+        proxy = urllib.request.getproxies().get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            proxy = None
+        else:
+            if '://' not in proxy:
+                proxy = 'http://' + proxy # e.g. HTTP_PROXY=proxy.example.com:3128
+            proxy = urllib.parse.urlsplit(proxy)
+        PROXY_CHOICES[(scheme, host)] = proxy
+    return PROXY_CHOICES[(scheme, host)]
+
+def proxy_headers(proxy):
+    """The Proxy-Authorization header for a proxy URL with a user name and password in it."""
+    if proxy is None or proxy.username is None:
+        return {}
+    credentials = urllib.parse.unquote(proxy.username) + ':' + urllib.parse.unquote(proxy.password or '')
+    return {'Proxy-Authorization': 'Basic ' + base64.b64encode(credentials.encode('utf-8')).decode('ascii')}
+
+def open_connection(scheme, host, port, proxy=None):
+    if proxy is not None:
+        proxy_port = proxy.port or (443 if proxy.scheme == 'https' else 80)
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(proxy.hostname, proxy_port, timeout=FETCH_TIMEOUT, context=SSL_CONTEXT)
+            conn.set_tunnel(host, port, headers=proxy_headers(proxy))
+            return conn
+        host, port = proxy.hostname, proxy_port
+        scheme = proxy.scheme
+    if scheme == 'https':
+        return http.client.HTTPSConnection(host, port, timeout=FETCH_TIMEOUT, context=SSL_CONTEXT)
+    return http.client.HTTPConnection(host, port, timeout=FETCH_TIMEOUT)
+
+def acquire_response(url, headers):
+    """
+    Sends a GET over a pooled connection and returns (key, connection, response)
+    with the body not read yet. Pass them to release_connection() once it is.
+    """
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https'):
+        raise urllib.error.URLError(f"unsupported URL scheme '{scheme}'")
+    proxy = proxy_for(scheme, parts.hostname)
+    key = (scheme, parts.hostname, parts.port or (443 if scheme == 'https' else 80), proxy and proxy.netloc)
+    path = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+    if proxy is not None and scheme == 'http':
+        # A plain HTTP proxy needs the full URL, and the credentials with every request
+        path = urllib.parse.urlunsplit((scheme, parts.netloc, parts.path or '/', parts.query, ''))
+        headers = dict(headers, **proxy_headers(proxy))
+
+    while True:
+        with POOL_LOCK:
+            idle = POOL.get(key)
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = open_connection(*key[:3], proxy)
+        try:
+            conn.request('GET', path, headers=headers)
+            return key, conn, conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if reused:
+                continue # The server closed the idle connection meanwhile: try again
+            raise
+
+def release_connection(key, conn, response):
+    """Puts a connection whose response has been read in full back into the pool."""
+    if not response.will_close:
+        with POOL_LOCK:
+            idle = POOL.setdefault(key, [])
+            if len(idle) < POOL_MAX_IDLE:
+                idle.append(conn)
+                return
+    conn.close()
+
+def pooled_request(url, headers):
+    """Sends a GET over a pooled connection and returns (status, reason, headers, raw body)."""
+    key, conn, response = acquire_response(url, headers)
+    try:
+        body = response.read()
+    except BaseException:
+        conn.close()
+        raise
+    release_connection(key, conn, response)
+    return response.status, response.reason, response.headers, body
+
+def close_pool():
+    """Closes every idle connection."""
+    with POOL_LOCK:
+        for idle in POOL.values():
+            for conn in idle:
+                conn.close()
+        POOL.clear()
+
+def decode_body(body, headers):
+    """Undoes gzip or deflate content encoding."""
+    encoding = (headers.get('Content-Encoding') or '').strip().lower()
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS) # Some servers send raw deflate data
+    return body
+
+def download(url):
+    """
+    Downloads a page and returns its HTML. Errors are raised to the caller.
+    Requests go through the connection pool, ask for gzip/deflate and follow
+    redirects. A cached page is revalidated with If-None-Match /
+    If-Modified-Since, and a 304 Not Modified answer is served from the cache.
+    """
+    # Set a User-Agent to mimic a browser
+    headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'}
+    cached = cache_lookup(url) if USE_CACHE else None
+    if cached:
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    target = url
+    for _ in range(MAX_REDIRECTS + 1):
+        try:
+            status, reason, response_headers, body = pooled_request(target, headers)
+        except (http.client.HTTPException, OSError) as e:
+            if isinstance(e, urllib.error.URLError):
+                raise
+            raise urllib.error.URLError(e)
+        if status not in (301, 302, 303, 307, 308) or 'Location' not in response_headers:
+            break
+        target = urllib.parse.urljoin(target, response_headers['Location'])
+    else:
+        raise urllib.error.URLError(f"more than {MAX_REDIRECTS} redirects")
+
+    if status == 304 and cached:
+        try:
+            body = cache_read(url)
+        except OSError:
+            # The cached copy disappeared (evicted by another thread): fetch it in full
+            with CACHE_LOCK:
+                CACHE_ENTRIES.pop(cache_key(url), None)
+            return download(url)
+        with CACHE_LOCK:
+            CACHE_STATS['hits'] += 1
+            CACHE_STATS['bytes_saved'] += len(body)
+        return body.decode('utf-8', errors='ignore')
+    if not 200 <= status < 300:
+        raise urllib.error.HTTPError(target, status, reason, response_headers, None)
+
+    body = decode_body(body, response_headers)
+    if USE_CACHE:
+        with CACHE_LOCK:
+            CACHE_STATS['misses'] += 1
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified:
+            cache_store(url, body, etag, last_modified)
+    return body.decode('utf-8', errors='ignore')
 
 def fetch_html(url):
     """
     Fetches the raw HTML content from a given URL using built-in Python libraries.
     """
     try:
-        # Create an unverified context to handle common SSL certificate issues
-        ssl._create_default_https_context = ssl._create_unverified_context
-        
-        # Set a User-Agent to mimic a browser
-        req = urllib.request.Request(
-            url, 
-            data=None, 
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-        )
-        
-        # Use a timeout for stability
-        with urllib.request.urlopen(req, timeout=15) as response:
-            html_content = response.read().decode('utf-8', errors='ignore')
-            print(f"[INFO] Successfully fetched HTML content from {url}")
-            return html_content
+        html_content = download(url)
+        print(f"[INFO] Successfully fetched HTML content from {url}")
+        return html_content
             
     except urllib.error.URLError as e:
         print(f"[ERROR] Could not reach the URL or connection error: {e.reason}")
@@ -37,51 +350,125 @@ def fetch_html(url):
         print(f"[ERROR] An unexpected error occurred during fetching: {e}")
         return None
 
-def get_patterns_for_url(url):
+# --- Site Profiles ---
+# The patterns for each retailer live in SITES_FILE, so a new retailer only needs
+# a new entry there. Every profile is compiled once when the file is loaded and
+# looked up by the page's hostname, so extracting a page builds no patterns.
+# An entry may also name a "container" element (e.g. the <div> around each
+# product on a listing page) so that a title and price are never paired across
+# two different products.
+
+SITES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper_sites.json")
+SITE_PROFILES = None # Hostname -> compiled profile, filled by load_site_profiles()
+DEFAULT_PROFILE = None # Used for websites that have no entry
+PAGE_TITLE_PATTERN = re.compile(r'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def element_pattern(element, whole_tag_name=False):
+    """Regex text for an opening tag with an optional exact attribute value, e.g. <h1 id="item_name">."""
+    tag = re.escape(element['tag'])
+    start = rf'<{tag}\b' if whole_tag_name else rf'<{tag}' # \b stops <b> from also matching <body>
+    if element.get('attr'):
+        attribute = rf'{re.escape(element["attr"])}=["\']{re.escape(element["value"])}["\']'
+        return tag, rf'{start}[^>]*{attribute}[^>]*>'
+    return tag, rf'{start}[^>]*>'
+
+def element_body(tag, nesting):
     """
-    Determines the appropriate scraping patterns based on the target URL.
-    This is based on the HTML snippets you provided.
+    Regex text for the inner HTML of a <tag> element, up to its own closing tag.
+    Same-named elements inside it (e.g. <span>₹</span> inside a price <span>)
+    are followed up to 'nesting' levels deep. Text runs are matched by [^<]* and
+    every other step starts at a '<' that only one branch accepts, so there is
+    exactly one way to match any text: an element that is never closed costs one
+    scan up to the next same-named tags, not a blow-up in backtracking.
     """
-    url_lower = url.lower()
-    
-    # Default to generic patterns if site is unknown or for testing static pages
-    title_tag, title_class, price_tag, price_class, price_regex = 'h2', '', 'span', '', r'[\$₹]\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
-
-    # --- TIRA PATTERNS (Based on your provided snippets) ---
-    if 'tira' in url_lower:
-        title_tag, title_class = 'h1', r'id=["\']item_name["\']'
-        price_tag, price_class = 'span', r'id=["\']item_price["\']'
-        price_regex = r'₹\s*(\d+)' # Matches the simple '₹379' format
-        print("[INFO] Using Tira-specific patterns.")
-
-    # --- AMAZON PATTERNS (Based on your provided snippets) ---
-    elif 'amazon' in url_lower:
-        # Note: Amazon title is found by ID and class; price by class.
-        title_tag, title_class = 'span', r'id=["\']productTitle["\']'
-        price_tag, price_class = 'span', r'class=["\']a-price-whole["\']'
-        price_regex = r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)' # Matches the simple '379' format
-        print("[INFO] Using Amazon-specific patterns.")
-        
-    # --- PURPLLE PATTERNS (Based on your provided snippets) ---
-    elif 'purplle' in url_lower:
-        # Note: Purplle title is in a span with a specific class; price in a strong tag.
-        title_tag, title_class = 'span', r'class=["\']fw-bold ng-star-inserted["\']'
-        price_tag, price_class = 'strong', r'class=["\']our-price text-dark-secondary["\']'
-        price_regex = r'₹\s*(\d+)'
-        print("[INFO] Using Purplle-specific patterns.")
-        
-    # --- NYKAA PATTERNS (Based on previous user input) ---
-    elif 'nykaa' in url_lower:
-        title_tag, title_class = 'h1', r'class=["\']css-1gc4x7i["\']'
-        price_tag, price_class = 'span', r'class=["\']css-1jczs19["\']'
-        price_regex = r'[\$₹]\s*(\d+)' 
-        print("[INFO] Using Nykaa-specific patterns.")
+    other = rf'<(?!/?{tag}\b)' # Any tag other than an opening or closing <tag>
+    if nesting:
+        other += rf'|<{tag}\b[^>]*>{element_body(tag, nesting - 1)}</{tag}\s*>'
+    return rf'[^<]*(?:(?:{other})[^<]*)*'
 
-    # Generate the full regex patterns
-    full_title_pattern = rf'<{title_tag}[^>]*{title_class}[^>]*>(.*?)</{title_tag}>'
-    full_price_pattern = rf'<{price_tag}[^>]*{price_class}[^>]*>.*?' + price_regex + rf'.*?</{price_tag}>'
+def element_scanner(name, element):
+    """
+    Regex text matching a whole element (minus its leading '<'). The named group
+    holds the '>' that ends the opening tag followed by the inner HTML, so it is
+    never empty, even for an empty element.
+    """
+    tag, opening = element_pattern(element, whole_tag_name=True)
+    return rf'{opening[1:-1]}(?P<{name}>>{element_body(tag, MAX_NESTING)})</{tag}\s*>'
 
-    return full_title_pattern, full_price_pattern
+def element_text(inner_html):
+    """The text of an element's inner HTML, without tags and with entities like &amp; decoded."""
+    if '<' in inner_html:
+        inner_html = TAG_PATTERN.sub('', inner_html)
+    if '&' in inner_html:
+        inner_html = html.unescape(inner_html)
+    return inner_html.strip()
+
+def compile_profile(site):
+    """
+    Turns one entry of SITES_FILE into a compiled profile: 'scanner' finds every
+    title, price and container element in one pass, 'title'/'price'/'container'
+    and 'price_regex' drive the streaming extractor, and 'title_pattern' and
+    'price_pattern' are the older separate scans, kept for comparison.
+    """
+    title_tag, title_open = element_pattern(site['title'])
+    price_tag, price_open = element_pattern(site['price'])
+    element = lambda spec: {'tag': spec['tag'].lower(), 'attr': spec.get('attr', '').lower(), 'value': spec.get('value')}
+    scanner = [element_scanner('title', site['title']), element_scanner('price', site['price'])]
+    if site.get('container'):
+        scanner.append(f"(?P<container>{element_pattern(site['container'], whole_tag_name=True)[1][1:]})")
+    else:
+        scanner.append("(?P<container>(?!))") # Never matches, but keeps findall() results three wide
+    # Every alternative starts with '<', so it is written once in front: the regex
+    # engine can then jump from one '<' to the next instead of trying each alternative at every character.
+    scanner = '<(?:' + '|'.join(scanner) + ')'
+    return {
+        'name': site['name'],
+        'title': element(site['title']),
+        'price': element(site['price']),
+        'container': element(site['container']) if site.get('container') else None,
+        'price_regex': re.compile(site['price_regex'], re.IGNORECASE),
+        'scanner': re.compile(scanner, re.IGNORECASE),
+        'title_pattern': re.compile(rf'{title_open}(.*?)</{title_tag}>', re.IGNORECASE | re.DOTALL),
+        'price_pattern': re.compile(rf'{price_open}.*?' + site['price_regex'] + rf'.*?</{price_tag}>',
+                                    re.IGNORECASE | re.DOTALL),
+    }
+
+def load_site_profiles():
+    """Reads and compiles SITES_FILE. Falls back to the generic patterns if it cannot be used."""
+    global SITE_PROFILES, DEFAULT_PROFILE
+    SITE_PROFILES = {}
+    DEFAULT_PROFILE = compile_profile({'name': 'Generic', 'title': {'tag': 'h2'}, 'price': {'tag': 'span'},
+                                       'price_regex': r'[\$₹]\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'})
+    try:
+        with open(SITES_FILE, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if 'default' in config:
+            DEFAULT_PROFILE = compile_profile(config['default'])
+        for site in config.get('sites', []):
+            profile = compile_profile(site)
+            for host in site['hosts']:
+                SITE_PROFILES[host.lower()] = profile
+    except FileNotFoundError:
+        print(f"[WARNING] {SITES_FILE} not found. Only the generic patterns will be used.")
+    except (ValueError, KeyError, TypeError, re.error) as e:
+        print(f"[ERROR] Could not load site profiles from {SITES_FILE}: {e}")
+
+def profile_for_url(url):
+    """
+    Finds the profile for a URL's hostname. 'www.amazon.in' is looked up as
+    'www.amazon.in', then 'amazon.in', then 'in', so one entry covers every
+    subdomain of a retailer.
+    """
+    if SITE_PROFILES is None:
+        load_site_profiles()
+    host = (urllib.parse.urlsplit(url).hostname or '').lower()
+    while host:
+        profile = SITE_PROFILES.get(host)
+        if profile:
+            return profile
+        host = host.partition('.')[2]
+    return DEFAULT_PROFILE
 
 def scrape_and_present_data(html_content, url):
     """
@@ -95,44 +482,25 @@ def scrape_and_present_data(html_content, url):
     print("      TARGETED COSMETICS PRODUCT SCRAPING RESULTS")
     print("="*70)
     
+    profile = profile_for_url(url)
+    if profile is not DEFAULT_PROFILE:
+        print(f"[INFO] Using {profile['name']}-specific patterns.")
+
     # 1. Extract the Page Title
-    title_match = re.search(r'<title>(.*?)</title>', html_content, re.IGNORECASE | re.DOTALL)
-    page_title = title_match.group(1).strip() if title_match else "Not Found"
+    page_title, products = extract_products(html_content, url)
     print(f"PAGE TITLE: {page_title}")
         
     print("-" * 70)
     print("SCRAPED COSMETIC PRODUCT LISTINGS:")
-    
-    # --- MODIFICATION AREA: TARGETING SPECIFIC HTML CLASSES ---
-    
-    # Get the correct patterns based on the URL
-    title_pattern_str, price_pattern_str = get_patterns_for_url(url)
-    
-    title_pattern = re.compile(title_pattern_str, re.IGNORECASE | re.DOTALL)
-    price_pattern = re.compile(price_pattern_str, re.IGNORECASE | re.DOTALL)
-
-    product_titles = [t.strip() for t in title_pattern.findall(html_content) if t.strip()]
-    
-    # The price pattern captures the price amount in the last group
-    price_matches = price_pattern.findall(html_content)
-    # If the price regex has a capture group for the amount, use the group, otherwise use the whole match.
-    product_prices = [match[-1].strip() for match in price_matches]
 
     # 2. Present the Data in a User-Friendly, Structured Format
-    
-    num_items = min(len(product_titles), len(product_prices), 5) # Limit to 5 results for clarity
 
-    if num_items > 0:
+    if products:
         print("{:<5} {:<45} {:<15}".format("ID", "Product Title (Cosmetics)", "Price"))
         print("-" * 70)
         
-        for i in range(num_items):
-            # Clean up the title by removing any nested HTML (like the span for volume)
-            clean_title = re.sub(r'<[^>]+>', '', product_titles[i]).strip()
-            
+        for i, (clean_title, price) in enumerate(products):
             title = clean_title[:40] + '...' if len(clean_title) > 40 else clean_title
-            # Price captured from the regex, which should include the currency symbol
-            price = product_prices[i].strip() if product_prices[i].strip() else "N/A"
             print(f"{i+1:<5} {title:<45} {price:<15}")
     else:
         print("  Could not find clear, structured product titles or prices using the defined patterns.")
@@ -140,17 +508,619 @@ def scrape_and_present_data(html_content, url):
         
     print("="*70)
 
+def extract_products(html_content, url):
+    """
+    Returns (page title, [(product title, price), ...]) for a page, using the
+    patterns for the page's website. The page is walked once, in document order:
+    a price belongs to the nearest title before it, and a new title or product
+    container ends the previous product, so a product without a price is left
+    out instead of taking the next product's price. A title or price holding
+    same-named elements more than MAX_NESTING deep is not recognised here,
+    although the streaming extractor still reads it.
+    """
+    title_match = PAGE_TITLE_PATTERN.search(html_content)
+    page_title = title_match.group(1).strip() if title_match else "Not Found"
+
+    # Get the precompiled patterns for the website (see scraper_sites.json)
+    profile = profile_for_url(url)
+    price_regex = profile['price_regex']
+
+    products = []
+    title = None # Title of the product being read, until its price is found
+    # Exactly one of the three groups is non-empty in each result, see element_scanner()
+    for title_html, price_html, container in profile['scanner'].findall(html_content):
+        if title_html:
+            # Drop the '>' of the opening tag and any nested HTML (like the span for volume)
+            title = element_text(title_html[1:]) or None
+        elif price_html:
+            if title is not None:
+                found = price_regex.search(element_text(price_html[1:]))
+                if found:
+                    # Use the last capture group for the amount (the whole match if there is none)
+                    products.append((title, found.group(price_regex.groups).strip()))
+                    title = None
+        else:
+            title = None # A product container starts a new product
+    return page_title, products
+
+def extract_products_legacy(html_content, url):
+    """
+    The earlier extractor: separate title and price scans over the whole page,
+    paired by position. Kept only so benchmark_extraction can compare against it.
+    """
+    title_match = PAGE_TITLE_PATTERN.search(html_content)
+    page_title = title_match.group(1).strip() if title_match else "Not Found"
+    profile = profile_for_url(url)
+
+    product_titles = [t.strip() for t in profile['title_pattern'].findall(html_content) if t.strip()]
+    
+    # The price pattern captures the price amount in the last group
+    price_matches = profile['price_pattern'].findall(html_content)
+    # If the price regex has a capture group for the amount, use the group, otherwise use the whole match.
+    # findall gives plain strings (not tuples) when there is a single group, so don't index those.
+    product_prices = [(match[-1] if isinstance(match, tuple) else match).strip() for match in price_matches]
+
+    products = []
+    for title, price in zip(product_titles, product_prices):
+        # Clean up the title by removing any nested HTML (like the span for volume)
+        clean_title = TAG_PATTERN.sub('', title).strip()
+        # Price captured from the regex, which should include the currency symbol
+        products.append((clean_title, price or "N/A"))
+    return page_title, products
+
+# --- Streaming Extraction ---
+# For very large listing pages: the page is read from the network a chunk at a
+# time and fed to an incremental HTML tokenizer, and each (title, price) record
+# is yielded as soon as both halves have been seen. Only the current chunk and
+# the element being read are held in memory, and the download is abandoned as
+# soon as the caller has all the products it asked for.
+
+class ProductStreamParser(HTMLParser):
+    """
+    Collects the text of the title and price elements described by a site
+    profile and pairs them the same way extract_products() does; finished
+    pairs wait in self.records. Unlike extract_products(), same-named elements
+    nested inside a title or price are followed to any depth, not just
+    MAX_NESTING levels.
+    """
+
+    def __init__(self, profile):
+        super().__init__(convert_charrefs=True)
+        self.profile = profile
+        self.records = deque()
+        self.title = None # Title of the product being read, until its price is found
+        self.page_title = None
+        self.capture = None # 'page_title', 'title' or 'price' while inside such an element
+        self.capture_tag = None
+        self.depth = 0 # Same-named tags nested inside the captured element
+        self.text = []
+
+    def matches(self, element, tag, attrs):
+        if tag != element['tag']:
+            return False
+        return not element['attr'] or dict(attrs).get(element['attr']) == element['value']
+
+    def handle_starttag(self, tag, attrs):
+        if self.capture:
+            if tag == self.capture_tag:
+                self.depth += 1
+            return
+        if self.profile['container'] and self.matches(self.profile['container'], tag, attrs):
+            self.title = None # A new product starts
+            return
+        if tag == 'title' and self.page_title is None:
+            kind = 'page_title'
+        elif self.matches(self.profile['title'], tag, attrs):
+            kind = 'title'
+        elif self.matches(self.profile['price'], tag, attrs):
+            kind = 'price'
+        else:
+            return
+        self.capture, self.capture_tag, self.depth, self.text = kind, tag, 0, []
+
+    def handle_endtag(self, tag):
+        if not self.capture or tag != self.capture_tag:
+            return
+        if self.depth:
+            self.depth -= 1
+            return
+        kind, text = self.capture, ''.join(self.text).strip()
+        self.capture = None
+        if kind == 'page_title':
+            self.page_title = text
+        elif kind == 'title':
+            self.title = text or None
+        elif self.title is not None:
+            match = self.profile['price_regex'].search(text)
+            if match:
+                # Use the last capture group for the amount, like extract_products()
+                self.records.append((self.title, match.group(len(match.groups())).strip()))
+                self.title = None
+
+    def handle_data(self, data):
+        if self.capture:
+            self.text.append(data)
+
+def stream_html(url, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yields a page's HTML as decoded text chunks while it downloads, undoing
+    gzip/deflate on the fly. The cache is not used. If the caller stops early,
+    the connection is closed instead of being returned to the pool.
+    """
+    headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'}
+    target = url
+    for _ in range(MAX_REDIRECTS + 1):
+        try:
+            key, conn, response = acquire_response(target, headers)
+        except (http.client.HTTPException, OSError) as e:
+            if isinstance(e, urllib.error.URLError):
+                raise
+            raise urllib.error.URLError(e)
+        if response.status not in (301, 302, 303, 307, 308) or 'Location' not in response.headers:
+            break
+        response.read()
+        release_connection(key, conn, response)
+        target = urllib.parse.urljoin(target, response.headers['Location'])
+    else:
+        raise urllib.error.URLError(f"more than {MAX_REDIRECTS} redirects")
+
+    finished = False
+    try:
+        if not 200 <= response.status < 300:
+            raise urllib.error.HTTPError(target, response.status, response.reason, response.headers, None)
+        encoding = (response.headers.get('Content-Encoding') or '').strip().lower()
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == 'gzip' else None
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        while True:
+            data = response.read(chunk_size)
+            if not data:
+                break
+            if encoding == 'deflate' and decompressor is None:
+                # zlib-wrapped data starts with a 0x?8 byte; anything else is raw deflate
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS if data[0] & 0x0F == 8 else -zlib.MAX_WBITS)
+            if decompressor:
+                data = decompressor.decompress(data)
+            text = decoder.decode(data)
+            if text:
+                yield text
+        text = decoder.decode(decompressor.flush() if decompressor else b'', final=True)
+        if text:
+            yield text
+        finished = True
+    finally:
+        if finished:
+            release_connection(key, conn, response)
+        else:
+            conn.close() # Part of the body is still unread, so the connection cannot be reused
+
+def stream_products(url, limit=None, parser=None):
+    """
+    Yields (product title, price) records while the page downloads, stopping
+    (and dropping the rest of the download) after 'limit' records. Pass a
+    ProductStreamParser to read its page_title afterwards.
+    """
+    parser = parser or ProductStreamParser(profile_for_url(url))
+    found = 0
+    chunks = stream_html(url)
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            while parser.records:
+                yield parser.records.popleft()
+                found += 1
+                if limit and found >= limit:
+                    return
+        parser.close()
+        while parser.records and not (limit and found >= limit):
+            yield parser.records.popleft()
+            found += 1
+    finally:
+        chunks.close()
+
+# --- Batch Mode ---
+# Fetches a whole list of URLs with a pool of worker threads. At most
+# MAX_WORKERS pages are downloaded at once, and at most MAX_PER_HOST of them
+# from the same website, so no retailer is hammered. URLs wait in a queue per
+# website and are only handed to a worker once their website has a free slot,
+# taking websites in turn, so a list that starts with thousands of pages from
+# one retailer does not hold up the others. Each page is extracted as soon as
+# it arrives instead of after the whole list has been downloaded.
+
+def fetch_many(urls, max_workers=MAX_WORKERS, per_host=MAX_PER_HOST):
+    """
+    Downloads every URL concurrently and yields (url, html, error) in the order
+    the downloads finish. html is None when error is set.
+    """
+    waiting = {} # Host -> URLs not started yet
+    for url in urls:
+        waiting.setdefault(urllib.parse.urlsplit(url).netloc.lower(), deque()).append(url)
+    running = dict.fromkeys(waiting, 0) # Host -> downloads in progress
+    ready = deque(waiting) # Hosts with URLs waiting and a free slot, in the order they get a turn
+    futures = {} # Future -> (url, host)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        def start_downloads():
+            while ready and len(futures) < max_workers:
+                host = ready.popleft()
+                url = waiting[host].popleft()
+                futures[pool.submit(download, url)] = (url, host)
+                running[host] += 1
+                if waiting[host] and running[host] < per_host:
+                    ready.append(host) # Back of the line, so every website gets a turn
+
+        start_downloads()
+        while futures:
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            results = []
+            for future in finished:
+                url, host = futures.pop(future)
+                running[host] -= 1
+                if waiting[host] and running[host] == per_host - 1:
+                    ready.append(host) # It was at its limit, so it was not in line yet
+                results.append((url, future))
+            start_downloads() # Keep the workers busy while the caller handles these pages
+            for url, future in results:
+                try:
+                    yield url, future.result(), None
+                except Exception as e: # One bad URL must not stop the batch
+                    yield url, None, e
+
+def read_url_list(file_name):
+    """Reads one URL per line, skipping blank lines and '#' comments."""
+    urls = []
+    with open(file_name, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                urls.append(line if line.startswith(('http://', 'https://')) else 'https://' + line)
+    return urls
+
+def scrape_batch(urls, output_file=None, max_workers=MAX_WORKERS, per_host=MAX_PER_HOST):
+    """
+    Scrapes every URL and prints a line per page as it finishes. If output_file
+    is given, every product found is also written to it as CSV.
+    """
+    writer = None
+    out = None
+    if output_file:
+        out = open(output_file, 'w', encoding='utf-8', newline='')
+        writer = csv.writer(out)
+        writer.writerow(['url', 'page_title', 'product_title', 'price'])
+
+    done = failed = product_count = 0
+    start_time = time.perf_counter()
+    try:
+        for url, html_content, error in fetch_many(urls, max_workers, per_host):
+            done += 1
+            if error is not None:
+                failed += 1
+                print(f"[ERROR] [{done}/{len(urls)}] {url}: {error}")
+                continue
+            page_title, products = extract_products(html_content, url)
+            product_count += len(products)
+            print(f"[INFO] [{done}/{len(urls)}] {url}: {len(products)} products")
+            if writer:
+                writer.writerows([url, page_title, title, price] for title, price in products)
+    finally:
+        if out:
+            out.close()
+
+    elapsed = time.perf_counter() - start_time
+    rate = done / elapsed if elapsed > 0 else 0
+    print(f"[SUCCESS] Scraped {done - failed} of {len(urls)} pages ({product_count} products) "
+          f"in {elapsed:.2f}s ({rate:.1f} pages/sec).")
+    if failed:
+        print(f"[WARNING] {failed} pages could not be fetched.")
+    if USE_CACHE:
+        print(f"[INFO] {cache_summary()}")
+
+# --- Benchmark ---
+
+BENCHMARK_PAGE = ("<html><head><title>Benchmark Store</title></head><body>"
+                  + "".join(f'<div class="product"><h2>Benchmark Lipstick {i}</h2><span>₹{100 + i}</span></div>'
+                            for i in range(20))
+                  + "</body></html>").encode('utf-8')
+
+BENCHMARK_PAGE_GZIP = gzip.compress(BENCHMARK_PAGE)
+BENCHMARK_ETAG = '"' + hashlib.sha256(BENCHMARK_PAGE).hexdigest()[:16] + '"'
+
+class BenchmarkHandler(BaseHTTPRequestHandler):
+    """
+    Serves the same product page for every path, after a delay that stands in
+    for network latency. Answers 304 when the client already has the page,
+    compresses it when the client accepts gzip and keeps connections open.
+    """
+    delay = 0.05
+    protocol_version = 'HTTP/1.1' # Needed for keep-alive
+    disable_nagle_algorithm = True # Otherwise the body waits ~40 ms behind the headers on a kept-alive connection
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        if self.headers.get('If-None-Match') == BENCHMARK_ETAG:
+            self.send_response(304)
+            self.send_header('ETag', BENCHMARK_ETAG)
+            self.end_headers()
+            return
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = BENCHMARK_PAGE_GZIP if gzipped else BENCHMARK_PAGE
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('ETag', BENCHMARK_ETAG)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # Keep the benchmark output readable
+
+class BenchmarkServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128 # The default of 5 refuses connections when many workers connect at once
+
+    def handle_error(self, request, client_address):
+        # The streaming extractor hangs up early on purpose, which can reset a kept-alive
+        # connection while the handler waits for its next request. That is not worth a traceback.
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+def benchmark_batch(pages=200, worker_counts=(1, 4, 16, 32)):
+    """
+    Scrapes 'pages' URLs from a local test server (50 ms per response) with
+    different pool sizes and prints pages/sec for each.
+    """
+    global USE_CACHE
+    server = BenchmarkServer(('127.0.0.1', 0), BenchmarkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base_url}/product/{i}" for i in range(pages)]
+
+    print("{:>8} {:>10} {:>12}".format("Workers", "Seconds", "Pages/sec"))
+    USE_CACHE = False # Every run must download the pages in full
+    try:
+        for workers in worker_counts:
+            start = time.perf_counter()
+            # Everything comes from one host here, so let the per-host cap match the pool
+            fetched = sum(1 for _, html_content, error in fetch_many(urls, workers, workers)
+                          if error is None and extract_products(html_content, base_url)[1])
+            elapsed = time.perf_counter() - start
+            print("{:>8} {:>9.2f}s {:>12.1f}{}".format(
+                workers, elapsed, pages / elapsed, "" if fetched == pages else f"  ({pages - fetched} failed)"))
+    finally:
+        USE_CACHE = True
+        server.shutdown()
+        server.server_close()
+
+class NoDelayHandler(BenchmarkHandler):
+    delay = 0
+
+class LargePageHandler(BaseHTTPRequestHandler):
+    """Serves LargePageHandler.page uncompressed, 64 KB at a time."""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    page = b''
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(self.page)))
+        self.end_headers()
+        try:
+            for start in range(0, len(self.page), 64 * 1024):
+                self.wfile.write(self.page[start:start + 64 * 1024])
+        except (BrokenPipeError, ConnectionResetError):
+            pass # The streaming extractor hung up early, as intended
+
+    def log_message(self, format, *args):
+        pass
+
+def benchmark_streaming(products=200_000, wanted=5):
+    """
+    Compares downloading a large listing page in full and then extracting it,
+    with streaming extraction that stops after 'wanted' products: time to the
+    results and peak Python memory (tracemalloc) for each.
+    """
+    global USE_CACHE
+    LargePageHandler.page = ("<html><head><title>Large Listing</title></head><body>"
+                             + "".join(f'<div class="product"><h2>Streaming Lipstick {i}</h2><span>₹{100 + i % 900}</span></div>'
+                                       for i in range(products))
+                             + "</body></html>").encode('utf-8')
+    server = BenchmarkServer(('127.0.0.1', 0), LargePageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/listing"
+
+    def whole_page():
+        return extract_products(download(url), url)[1][:wanted]
+
+    def streaming():
+        return list(stream_products(url, limit=wanted))
+
+    def streaming_all():
+        return list(stream_products(url))
+
+    print(f"[INFO] Page size: {len(LargePageHandler.page) / 1024 / 1024:.1f} MB, {products:,} products.")
+    print("{:<28} {:>10} {:>12} {:>10}".format("Method", "Seconds", "Peak Memory", "Products"))
+    USE_CACHE = False
+    try:
+        for label, run in (("Whole page, first " + str(wanted), whole_page),
+                           ("Streaming, first " + str(wanted), streaming),
+                           ("Streaming, every product", streaming_all)):
+            start = time.perf_counter()
+            found = run()
+            elapsed = time.perf_counter() - start
+            # Memory is measured in a second run, because tracing slows the parser down a lot
+            tracemalloc.start()
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("{:<28} {:>9.3f}s {:>9.1f} MB {:>10,}".format(label, elapsed, peak / 1024 / 1024, len(found)))
+    finally:
+        USE_CACHE = True
+        close_pool()
+        server.shutdown()
+        server.server_close()
+
+def benchmark_latency(requests=500):
+    """
+    Times sequential requests to a local test server, once with a new urllib
+    connection per request (the old fetch_html) and once through the connection
+    pool, and prints the average and median latency of each.
+    """
+    global USE_CACHE
+    server = BenchmarkServer(('127.0.0.1', 0), NoDelayHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/product"
+
+    def urllib_fetch():
+        req = urllib.request.Request(url, data=None, headers={'User-Agent': USER_AGENT})
+        with urllib.request.urlopen(req, timeout=FETCH_TIMEOUT) as response:
+            return response.read().decode('utf-8', errors='ignore')
+
+    print("{:<20} {:>12} {:>12}".format("Method", "Average", "Median"))
+    USE_CACHE = False
+    try:
+        for label, fetch in (("New connection", urllib_fetch), ("Connection pool", lambda: download(url))):
+            times = []
+            for _ in range(requests):
+                start = time.perf_counter()
+                fetch()
+                times.append(time.perf_counter() - start)
+            times.sort()
+            print("{:<20} {:>10.3f}ms {:>10.3f}ms".format(
+                label, sum(times) / len(times) * 1000, times[len(times) // 2] * 1000))
+    finally:
+        USE_CACHE = True
+        close_pool()
+        server.shutdown()
+        server.server_close()
+
+def write_benchmark_corpus(folder, pages=20, products=5000):
+    """
+    Saves synthetic listing pages to folder, shaped like real ones: badges and
+    ratings in <span>s that hold no price, every 10th product out of stock (no
+    price) and a footer of links. Returns the expected (title, price) records
+    of each file.
+    """
+    expected = {}
+    for page in range(pages):
+        parts = [f"<html><head><title>Listing {page}</title></head><body><h1>Bestsellers</h1>"]
+        records = []
+        for i in range(products):
+            title = f"Corpus Lipstick {page}-{i}"
+            parts.append(f'<div class="product"><a href="/p/{i}"><img src="/i/{i}.jpg"></a>'
+                         f'<span class="badge">New</span><h2>{title} <small>4.5 g</small></h2>'
+                         f'<span class="rating">4.{i % 10} stars</span>')
+            if i % 10 != 9:
+                price = str(100 + i % 900)
+                parts.append(f'<span class="price">₹{price}</span>')
+                records.append((title + " 4.5 g", price))
+            else:
+                parts.append('<span class="stock">Out of stock</span>')
+            parts.append('<button>Add to bag</button></div>\n')
+        parts.append("<footer>" + "".join(f'<span><a href="/help/{i}">Help topic {i}</a></span>' for i in range(300))
+                     + "</footer></body></html>")
+        file_name = os.path.join(folder, f"listing_{page}.html")
+        with open(file_name, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
+        expected[file_name] = records
+    return expected
+
+def benchmark_extraction(corpus_folder=None):
+    """
+    Times extract_products against extract_products_legacy over a folder of
+    saved .html pages (MB/s). Without a folder, a synthetic corpus is generated
+    and each extractor's pairs are also checked against the expected ones.
+    Saved pages are matched to a site profile by a hostname at the start of the
+    file name, e.g. 'amazon.in_lipstick.html'.
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        expected = {}
+        if corpus_folder is None:
+            corpus_folder = folder
+            expected = write_benchmark_corpus(folder)
+        pages = []
+        for name in sorted(os.listdir(corpus_folder)):
+            if name.endswith(('.html', '.htm')):
+                with open(os.path.join(corpus_folder, name), 'r', encoding='utf-8', errors='ignore') as f:
+                    pages.append((os.path.join(corpus_folder, name), "https://" + name.split('_')[0], f.read()))
+        if not pages:
+            print(f"[ERROR] No .html files found in {corpus_folder}.")
+            return
+        megabytes = sum(len(html_content.encode('utf-8')) for _, _, html_content in pages) / 1024 / 1024
+        print(f"[INFO] Corpus: {len(pages)} pages, {megabytes:.1f} MB.")
+
+        print("{:<14} {:>10} {:>10} {:>10} {:>14}".format("Extractor", "Seconds", "MB/s", "Products", "Correct Pairs"))
+        for label, extract in (("Single pass", extract_products), ("Legacy regex", extract_products_legacy)):
+            start = time.perf_counter()
+            results = [(file_name, extract(html_content, url)[1]) for file_name, url, html_content in pages]
+            elapsed = time.perf_counter() - start
+            found = sum(len(products) for _, products in results)
+            if expected:
+                correct = sum(len(set(products) & set(expected[file_name])) for file_name, products in results)
+                correct = f"{correct:,}/{sum(map(len, expected.values())):,}"
+            else:
+                correct = "-"
+            print("{:<14} {:>9.3f}s {:>10.1f} {:>10,} {:>14}".format(label, elapsed, megabytes / elapsed, found, correct))
+
+    # Broken markup must not make an extractor backtrack for ever: an <h2> that is
+    # never closed, then a long run of text and priced <span>s
+    malformed = ("<html><body><h2>Unclosed title " + "lorem ipsum " * 20_000
+                 + '<span class="price">₹499</span> ' * 5_000 + "</body></html>")
+    print(f"[INFO] Malformed page (unclosed <h2>): {len(malformed) / 1024:.0f} KB.")
+    for label, extract in (("Single pass", extract_products), ("Legacy regex", extract_products_legacy)):
+        start = time.perf_counter()
+        extract(malformed, "https://malformed.example")
+        elapsed = time.perf_counter() - start
+        print("{:<14} {:>9.3f}s{}".format(label, elapsed, "  [WARNING] too slow" if elapsed > 1 else ""))
+
+def benchmark_cache(pages=200):
+    """
+    Scrapes 'pages' URLs from the local test server twice through a fresh cache
+    in a temporary folder: the first pass downloads everything, the second
+    should be answered with 304s.
+    """
+    global CACHE_DIR, CACHE_ENTRIES
+    saved_settings = (CACHE_DIR, CACHE_ENTRIES, dict(CACHE_STATS))
+    server = BenchmarkServer(('127.0.0.1', 0), BenchmarkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_address[1]}/product/{i}" for i in range(pages)]
+
+    print("{:<14} {:>10} {:>6} {:>8} {:>14}".format("Pass", "Seconds", "Hits", "Misses", "Bytes Saved"))
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            CACHE_DIR = folder
+            CACHE_ENTRIES = None
+            for label in ("Cold cache", "Warm cache"):
+                CACHE_STATS.update(hits=0, misses=0, bytes_saved=0)
+                start = time.perf_counter()
+                for _ in fetch_many(urls):
+                    pass
+                elapsed = time.perf_counter() - start
+                print("{:<14} {:>9.2f}s {:>6} {:>8} {:>14,}".format(
+                    label, elapsed, CACHE_STATS['hits'], CACHE_STATS['misses'], CACHE_STATS['bytes_saved']))
+    finally:
+        CACHE_DIR, CACHE_ENTRIES, stats = saved_settings
+        CACHE_STATS.update(stats)
+        server.shutdown()
+        server.server_close()
+
 def main():
     """
     Main application loop for the interactive web scraper.
     """
     print("Welcome to the Interactive Cosmetic Product Scraper Simulator!")
-    print("The scraper is now configured to try patterns for Tira, Amazon, Purplle, and Nykaa.")
+    load_site_profiles()
+    names = sorted({profile['name'] for profile in SITE_PROFILES.values()})
+    print(f"The scraper is now configured to try patterns for {', '.join(names) or 'generic pages only'}.")
 
     while True:
         url_input = input("\nEnter the URL to scrape (e.g., https://tira.com/product/xyz) or type 'exit' to quit: ").strip()
         
         if url_input.lower() == 'exit':
+            if USE_CACHE:
+                print(f"\n[INFO] {cache_summary()}")
             print("\nExiting the Web Scraper. Goodbye!")
             break
 
@@ -165,4 +1135,36 @@ def main():
 
 # --- Execution Block ---
 if __name__ == "__main__":
-    main()
+    # python webscraping.py --batch URLS_FILE [OUTPUT_CSV] scrapes a list of URLs concurrently
+    # python webscraping.py --benchmark [pages] measures batch mode, the cache and the connection pool against a local test server
+    # python webscraping.py --stream URL [N] prints products while the page downloads, stopping after N
+    # python webscraping.py --benchmark-extraction [FOLDER] compares the extractors on saved .html pages
+    if len(sys.argv) in (3, 4) and sys.argv[1] == '--stream':
+        url = sys.argv[2] if sys.argv[2].startswith(('http://', 'https://')) else 'https://' + sys.argv[2]
+        limit = int(sys.argv[3]) if len(sys.argv) == 4 and sys.argv[3].isdigit() else None
+        parser = ProductStreamParser(profile_for_url(url))
+        try:
+            for number, (title, price) in enumerate(stream_products(url, limit, parser), start=1):
+                print(f"{number:<5} {title[:40] + '...' if len(title) > 40 else title:<45} {price:<15}")
+            print(f"[INFO] Page title: {parser.page_title or 'Not Found'}")
+        except urllib.error.URLError as e:
+            print(f"[ERROR] Could not reach the URL or connection error: {e.reason}")
+    elif len(sys.argv) in (3, 4) and sys.argv[1] == '--batch':
+        if os.path.exists(sys.argv[2]):
+            scrape_batch(read_url_list(sys.argv[2]), sys.argv[3] if len(sys.argv) == 4 else None)
+        else:
+            print(f"[ERROR] URL list {sys.argv[2]} not found.")
+    elif len(sys.argv) in (2, 3) and sys.argv[1] == '--benchmark-extraction':
+        benchmark_extraction(sys.argv[2] if len(sys.argv) == 3 else None)
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        try:
+            pages = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+        except ValueError:
+            pages = 200
+            print("Invalid page count. Using 200.")
+        benchmark_batch(pages)
+        benchmark_cache(pages)
+        benchmark_latency()
+        benchmark_streaming()
+    else:
+        main()